@@ -841,57 +841,53 @@ def main():
     from daily_report.content import regroup_content
     report.content = regroup_content(report, args.group_by)
 
-    # Optionally consolidate via AI (markdown → Claude → markdown)
-    if args.consolidate:
-        from daily_report.content import prepare_consolidated_content
+    # Optionally consolidate via AI (markdown → Claude → markdown) and/or
+    # replace the default summary stats with an AI summary. When both are
+    # requested, the two Claude calls run concurrently.
+    if args.consolidate or args.summary:
+        model = args.model or "claude-sonnet-4-5-20250929"
+        if args.consolidate and args.summary:
+            flag, task = "--consolidate/--summary", "AI content preparation"
+        elif args.consolidate:
+            flag, task = "--consolidate", "consolidation"
+        else:
+            flag, task = "--summary", "AI summary"
 
         # Build repo_paths for local git tool access
         repo_paths = {f"{r.org}/{r.name}": r.path for r in local_repos}
 
         try:
-            report.consolidated_markdown = prepare_consolidated_content(
-                report,
-                model=args.model or "claude-sonnet-4-5-20250929",
-                prompt=cfg.consolidate_prompt or None,
-                group_by=args.group_by,
-                repo_paths=repo_paths,
-            )
-        except ImportError as e:
-            missing = str(e)
-            if "anthropic" in missing:
-                print(
-                    "Error: anthropic package required for --consolidate. "
-                    "Install it with: pip install anthropic",
-                    file=sys.stderr,
+            if args.consolidate and args.summary:
+                from daily_report.content import prepare_both
+                report.consolidated_markdown, report.summary.ai_summary = prepare_both(
+                    report,
+                    model=model,
+                    consolidate_prompt=cfg.consolidate_prompt or None,
+                    summary_prompt=cfg.summary_prompt or None,
+                    group_by=args.group_by,
+                    repo_paths=repo_paths,
                 )
-            elif "claude_agent_sdk" in missing:
-                print(
-                    "Error: No ANTHROPIC_API_KEY set and claude-agent-sdk is not installed.\n"
-                    "Either set the ANTHROPIC_API_KEY environment variable, or install "
-                    "claude-agent-sdk for OAuth/subscription auth.",
-                    file=sys.stderr,
+            elif args.consolidate:
+                from daily_report.content import prepare_consolidated_content
+                report.consolidated_markdown = prepare_consolidated_content(
+                    report,
+                    model=model,
+                    prompt=cfg.consolidate_prompt or None,
+                    group_by=args.group_by,
+                    repo_paths=repo_paths,
                 )
             else:
-                print(f"Error: missing dependency for --consolidate: {e}", file=sys.stderr)
-            sys.exit(1)
-        except RuntimeError as e:
-            print(f"Error: consolidation failed: {e}", file=sys.stderr)
-            sys.exit(1)
-
-    # Prepare AI summary (replaces default summary stats)
-    if args.summary:
-        from daily_report.content import prepare_ai_summary
-        try:
-            report.summary.ai_summary = prepare_ai_summary(
-                report,
-                model=args.model or "claude-sonnet-4-5-20250929",
-                prompt=cfg.summary_prompt or None,
-            )
+                from daily_report.content import prepare_ai_summary
+                report.summary.ai_summary = prepare_ai_summary(
+                    report,
+                    model=model,
+                    prompt=cfg.summary_prompt or None,
+                )
         except ImportError as e:
             missing = str(e)
             if "anthropic" in missing:
                 print(
-                    "Error: anthropic package required for --summary. "
+                    f"Error: anthropic package required for {flag}. "
                     "Install it with: pip install anthropic",
                     file=sys.stderr,
                 )
@@ -903,10 +899,10 @@ def main():
                     file=sys.stderr,
                 )
             else:
-                print(f"Error: missing dependency for --summary: {e}", file=sys.stderr)
+                print(f"Error: missing dependency for {flag}: {e}", file=sys.stderr)
             sys.exit(1)
         except RuntimeError as e:
-            print(f"Error: AI summary failed: {e}", file=sys.stderr)
+            print(f"Error: {task} failed: {e}", file=sys.stderr)
             sys.exit(1)
 
     # Output
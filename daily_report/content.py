@@ -5,7 +5,8 @@ renderer-agnostic RepoContent structures. Supports two modes:
 
 - prepare_default_content(): groups PRs by repo with semantic ContentItems
 - prepare_consolidated_content(): AI consolidation via Claude API (markdown-in/out)
-- prepare_ai_summary(): AI-powered one-line summary (<320 chars)
+- prepare_ai_summary(): AI-powered one-line summary (at most 160 chars)
+- prepare_both(): runs consolidation and summary concurrently
 
 Authentication for consolidation (resolution order):
 1. ANTHROPIC_API_KEY env var  → uses anthropic Python SDK directly
@@ -16,11 +17,17 @@ Authentication for consolidation (resolution order):
 from __future__ import annotations
 
 import asyncio
+import functools
+import hashlib
 import json
 import logging
 import os
+import random
+import re
 import shlex
 import subprocess
+import tempfile
+import time
 from collections import defaultdict
 from pathlib import Path
 
@@ -36,11 +43,6 @@ from daily_report.report_data import (
     WaitingPR,
 )
 
-_SUMMARY_FORMAT = (
-    "Max 200 characters. "
-    "Return ONLY the summary text, nothing else — no quotes, no labels, no JSON."
-)
-
 _CONSOLIDATION_FORMAT = (
     "Return ONLY the consolidated Markdown report. "
     "Keep the same structure: # title, ## sections, - bullet items. "
@@ -49,6 +51,32 @@ _CONSOLIDATION_FORMAT = (
 
 _TOOL_OUTPUT_MAX = 8000
 
+# Caps on per-PR detail sent to the summary call (input-token budget).
+_MAX_BODY_CHARS = 500
+_MAX_CHANGED_FILES = 20
+
+# Reports with at most this many PRs are summarised locally, without Claude;
+# override with DAILY_REPORT_TRIVIAL_MAX_PRS.
+_TRIVIAL_MAX_PRS = 3
+
+# The summary is rendered on a single line; also stated in the README.
+_SUMMARY_MAX_CHARS = 160
+
+_SUMMARY_FORMAT = (
+    f"Max {_SUMMARY_MAX_CHARS} characters. "
+    "Return ONLY the summary text, nothing else — no quotes, no labels, no JSON."
+)
+
+_RETRY_TRIES = 5
+_RETRY_BASE_DELAY = 1.0
+_RETRY_MAX_DELAY = 30.0
+
+_BATCH_POLL_INTERVAL = 10.0
+
+_RESPONSE_CACHE_TTL = 6 * 3600  # seconds; override with DAILY_REPORT_CACHE_TTL
+
+
+_PROMPT_DIR = Path(__file__).parent / "prompts"
 
 _prompt_cache: dict[str, str] = {}
 
@@ -56,12 +84,70 @@ _prompt_cache: dict[str, str] = {}
 def _load_prompt(name: str) -> str:
     """Load and cache a behavioral prompt from ``prompts/{name}.md``."""
     if name not in _prompt_cache:
-        prompt_path = Path(__file__).parent / "prompts" / f"{name}.md"
-        with open(prompt_path) as f:
-            _prompt_cache[name] = f.read().strip()
+        prompt_path = _PROMPT_DIR / f"{name}.md"
+        _prompt_cache[name] = prompt_path.read_text(encoding="utf-8").strip()
     return _prompt_cache[name]
 
 
+def _system_prompt(prompt: str | None, name: str, format_text: str) -> str | list[dict]:
+    """Return the custom *prompt*, or the default ``prompts/{name}.md`` blocks.
+
+    The default is sent as two blocks: the behavioral prompt, then the
+    fixed output-format instructions in *format_text*. A fresh list is
+    returned on each call; only the prompt file contents are cached.
+    """
+    if prompt:
+        logger.debug("Using custom %s prompt (%d chars)", name, len(prompt))
+        return prompt
+    logger.debug("Using default %s prompt", name)
+    return [
+        {"type": "text", "text": _load_prompt(name)},
+        {"type": "text", "text": format_text},
+    ]
+
+
+_orjson = None
+_orjson_checked = False
+
+
+def _get_orjson():
+    """Import ``orjson`` on first use; return the cached module, or None if not installed."""
+    global _orjson, _orjson_checked
+    if not _orjson_checked:
+        try:
+            import orjson  # lazy import, optional: faster JSON encoding
+        except ImportError:
+            orjson = None
+        _orjson = orjson
+        _orjson_checked = True
+    return _orjson
+
+
+def _dumps_compact(obj) -> str:
+    """Serialize *obj* to compact JSON with sorted keys (orjson if installed)."""
+    orjson = _get_orjson()
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_SORT_KEYS).decode("utf-8")
+    return json.dumps(obj, separators=(",", ":"), sort_keys=True, ensure_ascii=False)
+
+
+def _env_number(name: str, default, convert=float):
+    """Return env var *name* converted with *convert*, or *default* if unset/invalid."""
+    value = os.environ.get(name)
+    if not value:
+        return default
+    try:
+        return convert(value)
+    except ValueError:
+        logger.warning("Ignoring invalid %s=%r", name, value)
+        return default
+
+
+def _trivial_max_prs() -> int:
+    """Return the PR count at or below which Claude is skipped (``DAILY_REPORT_TRIVIAL_MAX_PRS``)."""
+    return _env_number("DAILY_REPORT_TRIVIAL_MAX_PRS", _TRIVIAL_MAX_PRS, int)
+
+
 # ---------------------------------------------------------------------------
 # Tool definitions for consolidation
 # ---------------------------------------------------------------------------
@@ -101,7 +187,8 @@ CONSOLIDATION_TOOLS: list[dict] = [
         "name": "git_log",
         "description": (
             "View git commit history in a local repository. "
-            "Provide the repo name (owner/name) and optional git log arguments."
+            "Provide the repo name (owner/name) and optional git log arguments "
+            "(common read-only options only)."
         ),
         "input_schema": {
             "type": "object",
@@ -120,7 +207,8 @@ CONSOLIDATION_TOOLS: list[dict] = [
         "name": "git_diff",
         "description": (
             "View diffs in a local repository. "
-            "Provide the repo name (owner/name) and optional git diff arguments."
+            "Provide the repo name (owner/name) and optional git diff arguments "
+            "(common read-only options only)."
         ),
         "input_schema": {
             "type": "object",
@@ -145,82 +233,131 @@ def _truncate(text: str, max_len: int = _TOOL_OUTPUT_MAX) -> str:
     return text[:max_len] + f"\n\n... (truncated, {len(text)} total chars)"
 
 
-def _exec_gh_pr_view(repo: str, number: int) -> str:
-    """Execute gh pr view and return output."""
-    cmd = [
-        "gh", "pr", "view", str(number),
-        "-R", repo,
-        "--json", "title,body,state,isDraft,additions,deletions,files,reviews,comments",
-    ]
+def _run_tool_cmd(cmd: list[str]) -> tuple[str, bool]:
+    """Run a tool command and return ``(output, is_error)``.
+
+    *output* is the truncated stdout, or an error message when the command
+    fails or cannot be run.
+
+    Output is decoded as UTF-8 regardless of the locale; undecodable bytes
+    (e.g. binary diffs) are replaced rather than failing the tool call.
+    """
     try:
         result = subprocess.run(
-            cmd, capture_output=True, text=True, timeout=30,
+            cmd, capture_output=True, encoding="utf-8", errors="replace", timeout=30,
         )
         if result.returncode != 0:
-            return f"Error: {result.stderr.strip()[:500]}"
-        return _truncate(result.stdout.strip())
+            return f"Error: {result.stderr.strip()[:500]}", True
+        return _truncate(result.stdout.strip()), False
     except (subprocess.TimeoutExpired, FileNotFoundError) as e:
-        return f"Error: {e}"
+        return f"Error: {e}", True
 
 
-def _exec_gh_pr_diff(repo: str, number: int) -> str:
-    """Execute gh pr diff and return output."""
+def _exec_gh_pr_view(repo: str, number: int) -> tuple[str, bool]:
+    """Execute gh pr view and return ``(output, is_error)``."""
+    cmd = [
+        "gh", "pr", "view", str(number),
+        "-R", repo,
+        "--json", "title,body,state,isDraft,additions,deletions,files,reviews,comments",
+    ]
+    return _run_tool_cmd(cmd)
+
+
+def _exec_gh_pr_diff(repo: str, number: int) -> tuple[str, bool]:
+    """Execute gh pr diff and return ``(output, is_error)``."""
     cmd = ["gh", "pr", "diff", str(number), "-R", repo]
-    try:
-        result = subprocess.run(
-            cmd, capture_output=True, text=True, timeout=30,
-        )
-        if result.returncode != 0:
-            return f"Error: {result.stderr.strip()[:500]}"
-        return _truncate(result.stdout.strip())
-    except (subprocess.TimeoutExpired, FileNotFoundError) as e:
-        return f"Error: {e}"
+    return _run_tool_cmd(cmd)
+
+
+# Read-only options the model may pass to git log / git diff. Anything else
+# (e.g. --output, --no-index, --ext-diff) is rejected before running git.
+_GIT_COMMON_OPTIONS = frozenset({
+    "--stat", "--shortstat", "--numstat", "--name-only", "--name-status",
+    "--summary", "--no-color", "-p", "--patch", "-w", "--ignore-all-space",
+    "-U", "--unified", "--diff-filter", "-M", "--find-renames", "--",
+})
+_GIT_LOG_OPTIONS = _GIT_COMMON_OPTIONS | frozenset({
+    "--oneline", "-n", "--max-count", "--skip", "--since", "--until",
+    "--after", "--before", "--author", "--committer", "--grep", "--pretty",
+    "--format", "--date", "--no-merges", "--merges", "--first-parent",
+    "--reverse", "--abbrev-commit", "--decorate", "--graph",
+})
+_GIT_DIFF_OPTIONS = _GIT_COMMON_OPTIONS | frozenset({
+    "--cached", "--staged", "--merge-base", "--patience", "--histogram", "--minimal",
+})
+# Short options that accept an attached value, e.g. -n5, -U3, -M50%
+_GIT_SHORT_VALUE_OPTIONS = frozenset({"-n", "-U", "-M"})
+_GIT_NUMERIC_OPTION_RE = re.compile(r"-\d+")
+
+
+def _escapes_repo(token: str) -> bool:
+    """Return True if *token* is an absolute path or has a ``..`` path component.
+
+    Git falls back to ``--no-index`` mode when given paths outside the
+    repository, so such tokens would let git diff read arbitrary files.
+    Revision ranges like ``main..HEAD`` are not path components and pass.
+    """
+    return os.path.isabs(token) or ".." in re.split(r"[/\\]", token)
+
 
+def _parse_git_args(args: str, allowed: frozenset[str]) -> list[str]:
+    """Split *args* and reject any option not in *allowed*.
 
-def _exec_git_log(repo: str, args: str, repo_paths: dict[str, str]) -> str:
-    """Execute git log on a local repo."""
+    Non-option tokens (revisions, ranges, paths) pass through unless they
+    point outside the repository; everything after ``--`` is treated as a
+    path.
+
+    Raises:
+        ValueError: On unbalanced quotes, a disallowed option or a path
+            outside the repository.
+    """
+    tokens = shlex.split(args)
+    paths_only = False
+    for token in tokens:
+        if paths_only or not token.startswith("-"):
+            if _escapes_repo(token):
+                raise ValueError(f"path '{token}' is outside the repository")
+            continue
+        if token == "--":
+            paths_only = True
+            continue
+        if _GIT_NUMERIC_OPTION_RE.fullmatch(token):
+            continue
+        name = token.split("=", 1)[0]
+        if name in allowed or (name[:2] in _GIT_SHORT_VALUE_OPTIONS and name[:2] in allowed):
+            continue
+        raise ValueError(f"option '{name}' is not allowed")
+    return tokens
+
+
+def _exec_git_log(repo: str, args: str, repo_paths: dict[str, str]) -> tuple[str, bool]:
+    """Execute git log on a local repo and return ``(output, is_error)``."""
     path = repo_paths.get(repo)
     if not path:
-        return f"Error: no local path for repo '{repo}'. Available: {list(repo_paths.keys())}"
+        return f"Error: no local path for repo '{repo}'. Available: {list(repo_paths.keys())}", True
     try:
-        cmd = ["git", "-C", path, "log"] + shlex.split(args)
+        cmd = ["git", "-C", path, "log"] + _parse_git_args(args, _GIT_LOG_OPTIONS)
     except ValueError as e:
-        return f"Error parsing args: {e}"
-    try:
-        result = subprocess.run(
-            cmd, capture_output=True, text=True, timeout=30,
-        )
-        if result.returncode != 0:
-            return f"Error: {result.stderr.strip()[:500]}"
-        return _truncate(result.stdout.strip())
-    except (subprocess.TimeoutExpired, FileNotFoundError) as e:
-        return f"Error: {e}"
+        return f"Error parsing args: {e}", True
+    return _run_tool_cmd(cmd)
 
 
-def _exec_git_diff(repo: str, args: str, repo_paths: dict[str, str]) -> str:
-    """Execute git diff on a local repo."""
+def _exec_git_diff(repo: str, args: str, repo_paths: dict[str, str]) -> tuple[str, bool]:
+    """Execute git diff on a local repo and return ``(output, is_error)``."""
     path = repo_paths.get(repo)
     if not path:
-        return f"Error: no local path for repo '{repo}'. Available: {list(repo_paths.keys())}"
+        return f"Error: no local path for repo '{repo}'. Available: {list(repo_paths.keys())}", True
     try:
-        cmd = ["git", "-C", path, "diff"] + shlex.split(args)
+        cmd = ["git", "-C", path, "diff"] + _parse_git_args(args, _GIT_DIFF_OPTIONS)
     except ValueError as e:
-        return f"Error parsing args: {e}"
-    try:
-        result = subprocess.run(
-            cmd, capture_output=True, text=True, timeout=30,
-        )
-        if result.returncode != 0:
-            return f"Error: {result.stderr.strip()[:500]}"
-        return _truncate(result.stdout.strip())
-    except (subprocess.TimeoutExpired, FileNotFoundError) as e:
-        return f"Error: {e}"
+        return f"Error parsing args: {e}", True
+    return _run_tool_cmd(cmd)
 
 
 def _execute_tool(
     name: str, tool_input: dict, repo_paths: dict[str, str],
-) -> str:
-    """Dispatch a tool call to the appropriate executor."""
+) -> tuple[str, bool]:
+    """Dispatch a tool call to its executor and return ``(output, is_error)``."""
     logger.debug("Executing tool %s with input: %s", name, tool_input)
     if name == "gh_pr_view":
         result = _exec_gh_pr_view(tool_input["repo"], tool_input["number"])
@@ -239,8 +376,8 @@ def _execute_tool(
             repo_paths,
         )
     else:
-        result = f"Error: unknown tool '{name}'"
-    logger.debug("Tool %s result: %d chars", name, len(result))
+        result = f"Error: unknown tool '{name}'", True
+    logger.debug("Tool %s result: %d chars", name, len(result[0]))
     return result
 
 
@@ -256,15 +393,15 @@ def _dedup_pr_lists(
     Returns:
         Tuple of (authored_prs, reviewed_prs, waiting_prs) with duplicates removed.
     """
-    waiting_keys = {(pr.repo, pr.number) for pr in report.waiting_prs}
+    # One set of claimed keys, grown in priority order
+    seen = {(pr.repo, pr.number) for pr in report.waiting_prs}
 
     authored_prs = [pr for pr in report.authored_prs
-                    if (pr.repo, pr.number) not in waiting_keys]
-    authored_keys = {(pr.repo, pr.number) for pr in authored_prs}
+                    if (pr.repo, pr.number) not in seen]
+    seen.update((pr.repo, pr.number) for pr in authored_prs)
 
     reviewed_prs = [pr for pr in report.reviewed_prs
-                    if (pr.repo, pr.number) not in waiting_keys
-                    and (pr.repo, pr.number) not in authored_keys]
+                    if (pr.repo, pr.number) not in seen]
 
     return authored_prs, reviewed_prs, report.waiting_prs
 
@@ -273,6 +410,9 @@ def _dedup_pr_lists(
 # Default content preparation
 # ---------------------------------------------------------------------------
 
+_DEFAULT_HEADINGS = ("Worked on", "Reviewed", "Waiting for Review")
+
+
 def prepare_default_content(report: ReportData) -> list[RepoContent]:
     """Build RepoContent list from raw PR lists, grouped by repo.
 
@@ -284,74 +424,34 @@ def prepare_default_content(report: ReportData) -> list[RepoContent]:
     """
     authored_prs, reviewed_prs, waiting_prs = _dedup_pr_lists(report)
 
-    # Group PRs by repo
-    authored_by_repo: dict[str, list] = defaultdict(list)
-    reviewed_by_repo: dict[str, list] = defaultdict(list)
-    waiting_by_repo: dict[str, list] = defaultdict(list)
-
-    for pr in authored_prs:
-        authored_by_repo[pr.repo].append(pr)
-    for pr in reviewed_prs:
-        reviewed_by_repo[pr.repo].append(pr)
-    for pr in waiting_prs:
-        waiting_by_repo[pr.repo].append(pr)
-
-    all_repos = sorted(
-        set(authored_by_repo) | set(reviewed_by_repo) | set(waiting_by_repo)
-    )
+    # Group items by repo in one dict: repo -> (authored, reviewed, waiting)
+    per_repo: dict[str, tuple[list[ContentItem], ...]] = {}
+    for index, (prs, make_item) in enumerate((
+        (authored_prs, _make_authored_item),
+        (reviewed_prs, _make_reviewed_item),
+        (waiting_prs, _make_waiting_item),
+    )):
+        for pr in prs:
+            bucket = per_repo.get(pr.repo)
+            if bucket is None:
+                bucket = per_repo[pr.repo] = ([], [], [])
+            bucket[index].append(make_item(pr))
 
     result: list[RepoContent] = []
-    for repo_name in all_repos:
-        blocks: list[ContentBlock] = []
-
-        # Worked on
-        authored = authored_by_repo.get(repo_name, [])
-        if authored:
-            items: list[ContentItem] = []
-            for pr in authored:
-                items.append(ContentItem(
-                    title=pr.title,
-                    numbers=[pr.number],
-                    status=pr.status,
-                    additions=pr.additions,
-                    deletions=pr.deletions,
-                    author=pr.original_author if pr.contributed else "",
-                ))
-            blocks.append(ContentBlock(heading="Worked on", items=items))
-
-        # Reviewed
-        reviewed = reviewed_by_repo.get(repo_name, [])
-        if reviewed:
-            items = []
-            for pr in reviewed:
-                items.append(ContentItem(
-                    title=pr.title,
-                    numbers=[pr.number],
-                    status=pr.status,
-                    author=pr.author,
-                ))
-            blocks.append(ContentBlock(heading="Reviewed", items=items))
-
-        # Waiting for Review
-        waiting = waiting_by_repo.get(repo_name, [])
-        if waiting:
-            items = []
-            for pr in waiting:
-                items.append(ContentItem(
-                    title=pr.title,
-                    numbers=[pr.number],
-                    reviewers=list(pr.reviewers),
-                    days_waiting=pr.days_waiting,
-                ))
-            blocks.append(ContentBlock(heading="Waiting for Review", items=items))
-
-        if blocks:
-            result.append(RepoContent(repo_name=repo_name, blocks=blocks))
+    for repo_name, buckets in sorted(per_repo.items()):
+        # Every repo in per_repo has at least one PR, so blocks is never empty
+        blocks = [
+            ContentBlock(heading=heading, items=items)
+            for heading, items in zip(_DEFAULT_HEADINGS, buckets)
+            if items
+        ]
+        result.append(RepoContent(repo_name=repo_name, blocks=blocks))
 
     return result
 
 
-_STATUS_ORDER = ["Open", "Draft", "Merged", "Closed", "Waiting for Review"]
+_STATUS_ORDER = ("Open", "Draft", "Merged", "Closed", "Waiting for Review")
+_STATUS_RANK = {status: rank for rank, status in enumerate(_STATUS_ORDER)}
 
 
 def regroup_content(report: ReportData, group_by: str = "contribution") -> list[RepoContent]:
@@ -395,11 +495,15 @@ def _make_reviewed_item(pr) -> ContentItem:
 
 
 def _make_waiting_item(pr) -> ContentItem:
-    """Create a ContentItem from a WaitingPR."""
+    """Create a ContentItem from a WaitingPR.
+
+    The reviewers list is shared with the PR, not copied; formatters only
+    read it.
+    """
     return ContentItem(
         title=pr.title,
         numbers=[pr.number],
-        reviewers=list(pr.reviewers),
+        reviewers=pr.reviewers,
         days_waiting=pr.days_waiting,
     )
 
@@ -450,25 +554,31 @@ def _regroup_by_project(report: ReportData) -> list[RepoContent]:
     authored_prs, reviewed_prs, waiting_prs = _dedup_pr_lists(report)
 
     # Collect all PRs by (repo, status)
-    repo_status: dict[str, dict[str, list[ContentItem]]] = defaultdict(lambda: defaultdict(list))
+    repo_status: dict[str, dict[str, list[ContentItem]]] = {}
 
     for pr in authored_prs:
-        repo_status[pr.repo][pr.status].append(_make_authored_item(pr))
+        repo_status.setdefault(pr.repo, {}).setdefault(pr.status, []).append(
+            _make_authored_item(pr))
 
     for pr in reviewed_prs:
-        repo_status[pr.repo][pr.status].append(_make_reviewed_item(pr))
+        repo_status.setdefault(pr.repo, {}).setdefault(pr.status, []).append(
+            _make_reviewed_item(pr))
 
     for pr in waiting_prs:
-        repo_status[pr.repo]["Waiting for Review"].append(_make_waiting_item(pr))
+        repo_status.setdefault(pr.repo, {}).setdefault("Waiting for Review", []).append(
+            _make_waiting_item(pr))
 
     result: list[RepoContent] = []
     for repo in sorted(repo_status):
-        blocks: list[ContentBlock] = []
         statuses = repo_status[repo]
-        for status in _STATUS_ORDER:
-            items = statuses.get(status)
-            if items:
-                blocks.append(ContentBlock(heading=status, items=items))
+        # Only statuses present in this repo, in _STATUS_ORDER; unknown ones are dropped
+        blocks = [
+            ContentBlock(heading=status, items=statuses[status])
+            for status in sorted(
+                (status for status in statuses if status in _STATUS_RANK),
+                key=_STATUS_RANK.__getitem__,
+            )
+        ]
         if blocks:
             result.append(RepoContent(repo_name=repo, blocks=blocks))
 
@@ -480,21 +590,22 @@ def _regroup_by_status(report: ReportData) -> list[RepoContent]:
     authored_prs, reviewed_prs, waiting_prs = _dedup_pr_lists(report)
 
     # Collect all PRs by (status, repo)
-    status_repo: dict[str, dict[str, list[ContentItem]]] = defaultdict(lambda: defaultdict(list))
+    status_repo: dict[str, dict[str, list[ContentItem]]] = {}
 
     for pr in authored_prs:
         item = _make_authored_item(pr)
         # Clear status on item since the parent group IS the status
         item.status = ""
-        status_repo[pr.status][pr.repo].append(item)
+        status_repo.setdefault(pr.status, {}).setdefault(pr.repo, []).append(item)
 
     for pr in reviewed_prs:
         item = _make_reviewed_item(pr)
         item.status = ""
-        status_repo[pr.status][pr.repo].append(item)
+        status_repo.setdefault(pr.status, {}).setdefault(pr.repo, []).append(item)
 
     for pr in waiting_prs:
-        status_repo["Waiting for Review"][pr.repo].append(_make_waiting_item(pr))
+        status_repo.setdefault("Waiting for Review", {}).setdefault(pr.repo, []).append(
+            _make_waiting_item(pr))
 
     result: list[RepoContent] = []
     for status in _STATUS_ORDER:
@@ -525,7 +636,9 @@ def prepare_consolidated_content(
 
     Generates the default markdown report, sends it to Claude with tools
     for deeper analysis (gh pr view/diff, git log/diff), and returns
-    the consolidated markdown.
+    the consolidated markdown. Trivial reports (one repo, at most
+    ``_trivial_max_prs()`` PRs) are returned unchanged without calling Claude,
+    unless a custom *prompt* is given.
 
     Args:
         report: Complete report data with populated PR lists.
@@ -551,17 +664,22 @@ def prepare_consolidated_content(
         logger.debug("No content to consolidate — returning empty string")
         return ""
 
+    authored_prs, reviewed_prs, waiting_prs = _dedup_pr_lists(report)
+    all_prs = authored_prs + reviewed_prs + waiting_prs
+    if (
+        not prompt
+        and len(all_prs) <= _trivial_max_prs()
+        and len({pr.repo for pr in all_prs}) <= 1
+    ):
+        logger.debug(
+            "Trivial report (%d PRs, <=1 repo) — skipping consolidation",
+            len(all_prs),
+        )
+        return markdown_input.strip()
+
     logger.debug("Consolidation input (%d chars):\n%s", len(markdown_input), markdown_input)
 
-    if prompt:
-        system_prompt: str | list[dict] = prompt
-        logger.debug("Using custom consolidation prompt (%d chars)", len(prompt))
-    else:
-        system_prompt = [
-            {"type": "text", "text": _load_prompt("consolidation")},
-            {"type": "text", "text": _CONSOLIDATION_FORMAT},
-        ]
-        logger.debug("Using default consolidation prompt")
+    system_prompt = _system_prompt(prompt, "consolidation", _CONSOLIDATION_FORMAT)
 
     api_key = os.environ.get("ANTHROPIC_API_KEY", "")
     effective_repo_paths = repo_paths or {}
@@ -573,6 +691,7 @@ def prepare_consolidated_content(
         len(effective_repo_paths),
     )
 
+    # Not cached: the tools report live gh/git state, which changes between runs.
     text = _call_backend_with_tools(
         api_key, model, system_prompt, markdown_input,
         CONSOLIDATION_TOOLS, effective_repo_paths,
@@ -591,9 +710,13 @@ def prepare_ai_summary(
     model: str = "claude-sonnet-4-5-20250929",
     prompt: str | None = None,
 ) -> str:
-    """Generate a short AI-powered summary of the report (<320 chars).
+    """Generate a short AI-powered summary of the report.
 
-    Uses the same dual-backend as consolidation (SDK or CLI).
+    Uses the same backends as consolidation (anthropic SDK, Message Batches
+    or agent SDK). Reports with at most ``_trivial_max_prs()`` PRs (unless a
+    custom *prompt* is given), or any report when
+    ``DAILY_REPORT_LOCAL_SUMMARY=1`` is set, get a deterministic local
+    summary instead.
 
     Args:
         report: Complete report data with populated PR lists.
@@ -601,7 +724,7 @@ def prepare_ai_summary(
         prompt: Custom system prompt. Uses default if None.
 
     Returns:
-        Summary string (AI is prompted to stay under 320 characters).
+        Summary string (AI is prompted to stay within ``_SUMMARY_MAX_CHARS``).
 
     Raises:
         RuntimeError: If the API call fails.
@@ -611,16 +734,18 @@ def prepare_ai_summary(
         logger.debug("No repos data for AI summary — returning empty string")
         return ""
 
-    if prompt:
-        system_prompt: str | list[dict] = prompt
-        logger.debug("Using custom summary prompt (%d chars)", len(prompt))
-    else:
-        system_prompt = [
-            {"type": "text", "text": _load_prompt("summary")},
-            {"type": "text", "text": _SUMMARY_FORMAT},
-        ]
-        logger.debug("Using default summary prompt")
-    user_message = json.dumps(repos_data, indent=2)
+    total_prs = sum(
+        len(entries) for categories in repos_data.values() for entries in categories.values()
+    )
+    if not prompt and total_prs <= _trivial_max_prs():
+        logger.debug("Trivial report (%d PRs) — using local summary", total_prs)
+        return _local_summary(repos_data)
+    if os.environ.get("DAILY_REPORT_LOCAL_SUMMARY") == "1":
+        logger.debug("DAILY_REPORT_LOCAL_SUMMARY=1 — using local summary")
+        return _local_summary(repos_data)
+
+    system_prompt = _system_prompt(prompt, "summary", _SUMMARY_FORMAT)
+    user_message = _dumps_compact(repos_data)
 
     api_key = os.environ.get("ANTHROPIC_API_KEY", "")
     logger.debug(
@@ -630,21 +755,271 @@ def prepare_ai_summary(
         len(user_message),
         user_message,
     )
-    text = _call_backend(api_key, model, system_prompt, user_message)
+    text = _cached_call(
+        _backend_name(api_key), model, system_prompt, user_message,
+        functools.partial(_call_backend, api_key, model, system_prompt, user_message),
+    )
     result = text.strip()
     logger.debug("AI summary output (%d chars):\n%s", len(result), result)
     return result
 
 
+# ---------------------------------------------------------------------------
+# Combined consolidation + summary
+# ---------------------------------------------------------------------------
+
+async def aprepare_both(
+    report: ReportData,
+    model: str = "claude-sonnet-4-5-20250929",
+    consolidate_prompt: str | None = None,
+    summary_prompt: str | None = None,
+    group_by: str = "contribution",
+    repo_paths: dict[str, str] | None = None,
+) -> tuple[str, str]:
+    """Run consolidation and the AI summary concurrently.
+
+    The two calls are independent, so wall-clock time drops to the slower
+    of the two instead of their sum.
+
+    Returns:
+        Tuple of (consolidated markdown, summary).
+
+    Raises:
+        RuntimeError: If either API call fails.
+    """
+    # Populate content up front so the worker threads never race on it
+    if not report.content:
+        report.content = regroup_content(report, group_by)
+
+    loop = asyncio.get_running_loop()
+    consolidated, summary = await asyncio.gather(
+        loop.run_in_executor(None, functools.partial(
+            prepare_consolidated_content, report,
+            model=model, prompt=consolidate_prompt,
+            group_by=group_by, repo_paths=repo_paths,
+        )),
+        loop.run_in_executor(None, functools.partial(
+            prepare_ai_summary, report, model=model, prompt=summary_prompt,
+        )),
+    )
+    return consolidated, summary
+
+
+def prepare_both(
+    report: ReportData,
+    model: str = "claude-sonnet-4-5-20250929",
+    consolidate_prompt: str | None = None,
+    summary_prompt: str | None = None,
+    group_by: str = "contribution",
+    repo_paths: dict[str, str] | None = None,
+) -> tuple[str, str]:
+    """Synchronous wrapper around :func:`aprepare_both`.
+
+    Raises:
+        RuntimeError: If called from a running event loop (await
+            ``aprepare_both`` there instead), or if either API call fails.
+    """
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(aprepare_both(
+            report, model, consolidate_prompt, summary_prompt, group_by, repo_paths,
+        ))
+    raise RuntimeError(
+        "prepare_both() cannot be called from a running event loop; "
+        "await aprepare_both() instead"
+    )
+
+
+# ---------------------------------------------------------------------------
+# Response cache
+# ---------------------------------------------------------------------------
+
+def _response_cache_dir() -> Path:
+    """Return the directory holding cached Claude responses.
+
+    ``DAILY_REPORT_CACHE_DIR`` overrides the default of
+    ``$XDG_CACHE_HOME/daily-report`` (``~/.cache/daily-report``).
+    """
+    override = os.environ.get("DAILY_REPORT_CACHE_DIR")
+    if override:
+        return Path(override).expanduser()
+    base = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(base) / "daily-report"
+
+
+def _response_cache_ttl() -> float:
+    """Return the response cache TTL in seconds (``DAILY_REPORT_CACHE_TTL``)."""
+    return _env_number("DAILY_REPORT_CACHE_TTL", _RESPONSE_CACHE_TTL)
+
+
+def _cached_call(
+    backend: str,
+    model: str,
+    system_prompt: str | list[dict],
+    user_message: str,
+    fn,
+    tools: list[dict] | None = None,
+) -> str:
+    """Return a cached response for this exact request, or call *fn* and cache it.
+
+    Responses are keyed by a hash of backend, model, system prompt, user
+    message and tool definitions, and stored as text files younger than the
+    TTL. Only use this for requests whose answer depends on those inputs
+    alone, not on tool results read from live gh/git state. The cache is
+    best effort: I/O errors are logged and fall through to *fn*.
+    ``DAILY_REPORT_NO_CACHE=1`` bypasses it entirely.
+    """
+    if os.environ.get("DAILY_REPORT_NO_CACHE") == "1":
+        return fn()
+    if not isinstance(system_prompt, str):
+        system_prompt = json.dumps(system_prompt, sort_keys=True)
+    tools_key = json.dumps(tools, sort_keys=True) if tools else ""
+    key = hashlib.blake2b(
+        "\0".join((backend, model, system_prompt, user_message, tools_key)).encode("utf-8"),
+        digest_size=16,
+    ).hexdigest()
+    cache_dir = _response_cache_dir()
+    path = cache_dir / f"{key}.txt"
+
+    try:
+        if time.time() - path.stat().st_mtime < _response_cache_ttl():
+            logger.debug("Response cache hit: %s", path)
+            return path.read_text(encoding="utf-8")
+    except OSError:
+        pass
+
+    text = fn()
+    if not text.strip():
+        return text
+    tmp_name = None
+    try:
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        fd, tmp_name = tempfile.mkstemp(dir=cache_dir, suffix=".tmp")
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            f.write(text)
+        os.replace(tmp_name, path)
+    except OSError as e:
+        logger.debug("Could not write response cache %s: %s", path, e)
+        if tmp_name is not None:
+            try:
+                os.unlink(tmp_name)
+            except OSError:
+                pass
+    return text
+
+
 # ---------------------------------------------------------------------------
 # Backend callers
 # ---------------------------------------------------------------------------
 
+_anthropic = None
+_claude_agent_sdk = None
+
+
+def _get_anthropic():
+    """Import ``anthropic`` on first use and return the cached module."""
+    global _anthropic
+    if _anthropic is None:
+        import anthropic  # lazy import
+
+        _anthropic = anthropic
+    return _anthropic
+
+
+def _get_claude_agent_sdk():
+    """Import ``claude_agent_sdk`` on first use and return the cached module."""
+    global _claude_agent_sdk
+    if _claude_agent_sdk is None:
+        import claude_agent_sdk  # lazy import
+
+        _claude_agent_sdk = claude_agent_sdk
+    return _claude_agent_sdk
+
+
+@functools.lru_cache(maxsize=4)
+def _get_anthropic_client(api_key: str):
+    """Return a cached ``anthropic.Anthropic`` client for *api_key*.
+
+    Reusing the client keeps its HTTP connection pool alive across tool-use
+    turns and across the consolidation and summary calls.
+    """
+    anthropic = _get_anthropic()
+
+    # Retries are handled by _retry_with_backoff, not stacked on the SDK's own.
+    return anthropic.Anthropic(api_key=api_key, max_retries=0)
+
+
+def _retry_with_backoff(
+    fn,
+    *,
+    retry_on: tuple[type[BaseException], ...],
+    retry_if=None,
+    tries: int = _RETRY_TRIES,
+    base: float = _RETRY_BASE_DELAY,
+    cap: float = _RETRY_MAX_DELAY,
+):
+    """Call *fn* and retry on *retry_on* errors with jittered exponential backoff.
+
+    If *retry_if* is given, a *retry_on* error is only retried when
+    ``retry_if(error)`` is true. Sleeps ``min(cap, base * 2**attempt) +
+    random()`` seconds between attempts and re-raises the last error once
+    *tries* attempts are used up.
+    """
+    for attempt in range(tries):
+        try:
+            return fn()
+        except retry_on as e:
+            if attempt == tries - 1 or (retry_if is not None and not retry_if(e)):
+                raise
+            delay = min(cap, base * 2 ** attempt) + random.random()
+            logger.debug(
+                "Transient error (%s), retry %d/%d in %.1fs",
+                type(e).__name__, attempt + 1, tries - 1, delay,
+            )
+            time.sleep(delay)
+
+
+def _transient_errors(anthropic) -> tuple[type[BaseException], ...]:
+    """Return the anthropic exception types that may be transient.
+
+    Status errors are narrowed down further by ``_is_transient_error``.
+    """
+    return (anthropic.APIConnectionError, anthropic.APIStatusError)
+
+
+def _is_transient_error(error: BaseException) -> bool:
+    """Return True for network errors and 408, 409, 429 or 5xx (incl. 529) responses.
+
+    Mirrors the SDK's own retry policy, which is disabled on our client,
+    except that timeouts are not retried: a hung request has already cost
+    the full client timeout, and retrying it would stall the run for minutes.
+    """
+    if isinstance(error, _get_anthropic().APITimeoutError):
+        return False
+    status = getattr(error, "status_code", None)
+    return status is None or status in (408, 409, 429) or status >= 500
+
+
+def _backend_name(api_key: str) -> str:
+    """Return the backend ``_call_backend`` uses: ``"batch"``, ``"sdk"`` or ``"agent"``."""
+    if not api_key:
+        return "agent"
+    return "batch" if os.environ.get("DAILY_REPORT_BATCH") == "1" else "sdk"
+
+
 def _call_backend(
     api_key: str, model: str, system_prompt: str | list[dict], user_message: str,
 ) -> str:
-    """Call the AI backend (SDK or agent SDK) without tools."""
-    if api_key:
+    """Call the AI backend (SDK, Message Batches or agent SDK) without tools."""
+    backend = _backend_name(api_key)
+    if backend == "batch":
+        logger.debug("Using Message Batches backend (DAILY_REPORT_BATCH=1)")
+        results = _call_via_batch(api_key, {
+            "request": _message_params(model, system_prompt, user_message),
+        })
+        return results["request"]
+    if backend == "sdk":
         logger.debug("Using anthropic SDK backend (API key present)")
         return _call_via_sdk(api_key, model, system_prompt, user_message)
     logger.debug("No ANTHROPIC_API_KEY — falling back to Claude Agent SDK")
@@ -669,35 +1044,149 @@ def _call_backend_with_tools(
     return _call_via_sdk_agent_with_tools(model, system_prompt, user_message)
 
 
+def _cacheable_system(system_prompt: str | list[dict]) -> list[dict]:
+    """Return *system_prompt* as text blocks with a cache breakpoint on the last one.
+
+    The system prompt is identical across calls, so marking it lets the API
+    serve it (and the tool definitions before it) from the prompt cache.
+    """
+    if isinstance(system_prompt, str):
+        blocks = [{"type": "text", "text": system_prompt}]
+    else:
+        blocks = [dict(block) for block in system_prompt]
+    if blocks:
+        blocks[-1]["cache_control"] = {"type": "ephemeral"}
+    return blocks
+
+
+def _cacheable_user_message(user_message: str) -> dict:
+    """Wrap *user_message* in a user turn whose text block is a cache breakpoint.
+
+    Re-running the same report within the cache TTL then reads the whole
+    input (system prompt + report payload) from the prompt cache.
+    """
+    return {
+        "role": "user",
+        "content": [
+            {"type": "text", "text": user_message, "cache_control": {"type": "ephemeral"}},
+        ],
+    }
+
+
+def _extract_text(content) -> str:
+    """Join the text of all ``text`` blocks in a Messages API response."""
+    return "".join(block.text for block in content if block.type == "text")
+
+
+def _message_params(
+    model: str, system_prompt: str | list[dict], user_message: str,
+) -> dict:
+    """Build ``messages.create`` parameters for a single tool-free request."""
+    return {
+        "model": model,
+        "max_tokens": 4096,
+        "messages": [_cacheable_user_message(user_message)],
+        "system": _cacheable_system(system_prompt),
+    }
+
+
+def _call_via_batch(
+    api_key: str,
+    requests: dict[str, dict],
+    poll_interval: float = _BATCH_POLL_INTERVAL,
+) -> dict[str, str]:
+    """Run requests through the Message Batches API and wait for the results.
+
+    Batches are billed at half the price of synchronous calls but may take
+    minutes (up to 24h, after which they expire) to complete, so this suits
+    unattended cron/CI runs rather than interactive use.
+
+    Args:
+        api_key: Anthropic API key.
+        requests: Map of custom_id → ``messages.create`` parameters.
+        poll_interval: Seconds to wait between status checks.
+
+    Returns:
+        Map of custom_id → response text.
+
+    Raises:
+        RuntimeError: If the API call fails or any request does not succeed.
+    """
+    anthropic = _get_anthropic()
+    client = _get_anthropic_client(api_key)
+    retry_on = _transient_errors(anthropic)
+    try:
+        batch = _retry_with_backoff(
+            functools.partial(
+                client.messages.batches.create,
+                requests=[
+                    {"custom_id": custom_id, "params": params}
+                    for custom_id, params in requests.items()
+                ],
+            ),
+            retry_on=retry_on,
+            retry_if=_is_transient_error,
+        )
+        logger.debug("Submitted message batch %s (%d requests)", batch.id, len(requests))
+        while batch.processing_status != "ended":
+            time.sleep(poll_interval)
+            batch = _retry_with_backoff(
+                functools.partial(client.messages.batches.retrieve, batch.id),
+                retry_on=retry_on,
+                retry_if=_is_transient_error,
+            )
+            logger.debug("Batch %s status: %s", batch.id, batch.processing_status)
+        entries = list(client.messages.batches.results(batch.id))
+    except anthropic.APIError as e:
+        logger.debug("Claude batch API error: %s (%s)", type(e).__name__, e)
+        raise RuntimeError(f"Claude batch API call failed: {e}") from e
+
+    texts: dict[str, str] = {}
+    for entry in entries:
+        if entry.result.type != "succeeded":
+            raise RuntimeError(
+                f"Claude batch request '{entry.custom_id}' {entry.result.type}"
+            )
+        texts[entry.custom_id] = _extract_text(entry.result.message.content)
+    missing = set(requests) - set(texts)
+    if missing:
+        raise RuntimeError(f"Claude batch returned no result for: {sorted(missing)}")
+    return texts
+
+
 def _call_via_sdk(
     api_key: str, model: str, system_prompt: str | list[dict], user_message: str,
 ) -> str:
     """Call Claude via the anthropic Python SDK (API key auth), no tools."""
-    import anthropic  # lazy import
+    anthropic = _get_anthropic()
 
     logger.debug("Calling Claude SDK (anthropic) with model=%s", model)
-    client = anthropic.Anthropic(api_key=api_key)
+    client = _get_anthropic_client(api_key)
     try:
-        response = client.messages.create(
-            model=model,
-            max_tokens=4096,
-            timeout=120.0,
-            messages=[{"role": "user", "content": user_message}],
-            system=system_prompt,
+        response = _retry_with_backoff(
+            functools.partial(
+                client.messages.create,
+                model=model,
+                max_tokens=4096,
+                timeout=120.0,
+                messages=[_cacheable_user_message(user_message)],
+                system=_cacheable_system(system_prompt),
+            ),
+            retry_on=_transient_errors(anthropic),
+            retry_if=_is_transient_error,
         )
     except anthropic.APIError as e:
         logger.debug("Claude SDK API error: %s (%s)", type(e).__name__, e)
         raise RuntimeError(f"Claude API call failed: {e}") from e
 
-    text = ""
-    for block in response.content:
-        if block.type == "text":
-            text += block.text
+    text = _extract_text(response.content)
     logger.debug(
-        "Claude SDK response: model=%s, stop=%s, usage=%s, %d chars",
+        "Claude SDK response: model=%s, stop=%s, usage=in=%d/out=%d/cache_read=%s, %d chars",
         response.model,
         response.stop_reason,
-        f"in={response.usage.input_tokens}/out={response.usage.output_tokens}",
+        response.usage.input_tokens,
+        response.usage.output_tokens,
+        getattr(response.usage, "cache_read_input_tokens", None),
         len(text),
     )
     return text
@@ -717,23 +1206,30 @@ def _call_via_sdk_with_tools(
     Sends the initial message, then loops handling tool_use responses
     until Claude returns a final text response (stop_reason == "end_turn").
     """
-    import anthropic  # lazy import
+    anthropic = _get_anthropic()
 
     logger.debug("Calling Claude SDK with tools, model=%s, max_turns=%d", model, max_turns)
-    client = anthropic.Anthropic(api_key=api_key)
+    client = _get_anthropic_client(api_key)
 
-    messages: list[dict] = [{"role": "user", "content": user_message}]
+    messages: list[dict] = [_cacheable_user_message(user_message)]
+    system = _cacheable_system(system_prompt)
+    cached_block: dict | None = None
 
     for turn in range(max_turns):
         logger.debug("Tool conversation turn %d", turn + 1)
         try:
-            response = client.messages.create(
-                model=model,
-                max_tokens=4096,
-                timeout=120.0,
-                messages=messages,
-                system=system_prompt,
-                tools=tools,
+            response = _retry_with_backoff(
+                functools.partial(
+                    client.messages.create,
+                    model=model,
+                    max_tokens=4096,
+                    timeout=120.0,
+                    messages=messages,
+                    system=system,
+                    tools=tools,
+                ),
+                retry_on=_transient_errors(anthropic),
+                retry_if=_is_transient_error,
             )
         except anthropic.APIError as e:
             logger.debug("Claude SDK API error on turn %d: %s (%s)", turn + 1, type(e).__name__, e)
@@ -750,11 +1246,7 @@ def _call_via_sdk_with_tools(
 
         # If no tool use, extract text and return
         if response.stop_reason == "end_turn":
-            text = ""
-            for block in response.content:
-                if block.type == "text":
-                    text += block.text
-            return text
+            return _extract_text(response.content)
 
         # Handle tool_use blocks
         tool_results = []
@@ -763,20 +1255,24 @@ def _call_via_sdk_with_tools(
             if block.type == "tool_use":
                 has_tool_use = True
                 logger.debug("Tool call: %s(%s)", block.name, block.input)
-                result = _execute_tool(block.name, block.input, repo_paths)
+                result, is_error = _execute_tool(block.name, block.input, repo_paths)
                 tool_results.append({
                     "type": "tool_result",
                     "tool_use_id": block.id,
                     "content": result,
+                    "is_error": is_error,
                 })
 
         if not has_tool_use:
             # No tool use and not end_turn — extract whatever text we have
-            text = ""
-            for block in response.content:
-                if block.type == "text":
-                    text += block.text
-            return text
+            return _extract_text(response.content)
+
+        # Move the single cache breakpoint to the newest tool result so the
+        # next turn reads the whole conversation so far from the prompt cache
+        if cached_block is not None:
+            del cached_block["cache_control"]
+        cached_block = tool_results[-1]
+        cached_block["cache_control"] = {"type": "ephemeral"}
 
         # Append assistant response and tool results to conversation
         messages.append({"role": "assistant", "content": response.content})
@@ -792,41 +1288,7 @@ def _call_via_sdk_agent(
 ) -> str:
     """Call Claude via ``claude-agent-sdk`` (subscription / OAuth auth), no tools."""
     logger.debug("Calling Claude Agent SDK with model=%s", model)
-    from claude_agent_sdk import (  # lazy import
-        ClaudeAgentOptions,
-        ResultMessage,
-        query,
-    )
-
-    if isinstance(system_prompt, list):
-        system_text = "\n\n".join(block["text"] for block in system_prompt)
-    else:
-        system_text = system_prompt
-    full_prompt = f"{system_text}\n\n{user_message}"
-    logger.debug("Agent SDK prompt length: %d chars", len(full_prompt))
-    options = ClaudeAgentOptions(
-        model=model,
-        max_turns=1,
-        allowed_tools=[],
-    )
-
-    async def _run() -> str:
-        result_text = ""
-        try:
-            async for message in query(prompt=full_prompt, options=options):
-                logger.debug("Agent SDK message: %s", type(message).__name__)
-                if isinstance(message, ResultMessage):
-                    result_text = message.result or ""
-        except Exception as e:
-            logger.debug("Agent SDK error: %s (%s)", type(e).__name__, e)
-            raise RuntimeError(f"Claude Agent SDK call failed: {e}") from e
-        return result_text
-
-    text = asyncio.run(_run())
-    if not text:
-        raise RuntimeError("Claude Agent SDK returned empty response")
-    logger.debug("Agent SDK response: %d chars", len(text))
-    return text
+    return _run_sdk_agent(model, system_prompt, user_message, max_turns=1, allowed_tools=[])
 
 
 def _call_via_sdk_agent_with_tools(
@@ -838,30 +1300,43 @@ def _call_via_sdk_agent_with_tools(
     tool and let Claude run gh/git commands itself.
     """
     logger.debug("Calling Claude Agent SDK with Bash tool, model=%s", model)
-    from claude_agent_sdk import (  # lazy import
-        ClaudeAgentOptions,
-        ResultMessage,
-        query,
+    return _run_sdk_agent(
+        model, system_prompt, user_message, max_turns=10, allowed_tools=["Bash"],
     )
 
+
+def _run_sdk_agent(
+    model: str,
+    system_prompt: str | list[dict],
+    user_message: str,
+    max_turns: int,
+    allowed_tools: list[str],
+) -> str:
+    """Run one agent SDK query and return its final result text.
+
+    Raises:
+        RuntimeError: If the query fails or returns an empty result.
+    """
+    sdk = _get_claude_agent_sdk()
+
     if isinstance(system_prompt, list):
         system_text = "\n\n".join(block["text"] for block in system_prompt)
     else:
         system_text = system_prompt
     full_prompt = f"{system_text}\n\n{user_message}"
     logger.debug("Agent SDK prompt length: %d chars", len(full_prompt))
-    options = ClaudeAgentOptions(
+    options = sdk.ClaudeAgentOptions(
         model=model,
-        max_turns=10,
-        allowed_tools=["Bash"],
+        max_turns=max_turns,
+        allowed_tools=allowed_tools,
     )
 
     async def _run() -> str:
         result_text = ""
         try:
-            async for message in query(prompt=full_prompt, options=options):
+            async for message in sdk.query(prompt=full_prompt, options=options):
                 logger.debug("Agent SDK message: %s", type(message).__name__)
-                if isinstance(message, ResultMessage):
+                if isinstance(message, sdk.ResultMessage):
                     result_text = message.result or ""
         except Exception as e:
             logger.debug("Agent SDK error: %s (%s)", type(e).__name__, e)
@@ -879,15 +1354,65 @@ def _call_via_sdk_agent_with_tools(
 # Helpers for AI summary
 # ---------------------------------------------------------------------------
 
+_LOCAL_SUMMARY_PHRASES = (
+    ("authored", "worked on {n} {prs} in {repo}"),
+    ("contributed", "contributed to {n} {prs} in {repo}"),
+    ("reviewed", "reviewed {n} {prs} in {repo}"),
+    ("waiting_for_review", "{n} {prs} awaiting review in {repo}"),
+)
+
+
+def _local_summary(repos_data: dict[str, dict[str, list[dict]]]) -> str:
+    """Build a deterministic one-line summary from ``_build_repos_data`` output.
+
+    Example: ``"Worked on 2 PRs in org/alpha; reviewed 1 PR in org/beta."``
+    When that would exceed ``_SUMMARY_MAX_CHARS``, falls back to aggregate
+    counts, e.g. ``"8 authored, 5 reviewed, 0 awaiting review across 13 repos."``
+    """
+    parts = []
+    for repo in sorted(repos_data):
+        categories = repos_data[repo]
+        for category, phrase in _LOCAL_SUMMARY_PHRASES:
+            n = len(categories.get(category, ()))
+            if n:
+                parts.append(phrase.format(n=n, prs="PR" if n == 1 else "PRs", repo=repo))
+    if not parts:
+        return ""
+    text = "; ".join(parts)
+    text = text[0].upper() + text[1:] + "."
+    if len(text) <= _SUMMARY_MAX_CHARS:
+        return text
+
+    def count(*categories: str) -> int:
+        return sum(
+            len(data.get(category, ())) for data in repos_data.values()
+            for category in categories
+        )
+
+    n = len(repos_data)
+    text = (
+        f"{count('authored', 'contributed')} authored, {count('reviewed')} reviewed, "
+        f"{count('waiting_for_review')} awaiting review "
+        f"across {n} {'repo' if n == 1 else 'repos'}."
+    )
+    return text[:_SUMMARY_MAX_CHARS]
+
+
 def _build_repos_data(report: ReportData) -> dict[str, dict[str, list[dict]]]:
     """Build a dict of repo -> categorized PR summaries for the AI prompt.
 
+    PR bodies are cut to ``_MAX_BODY_CHARS`` and file lists to
+    ``_MAX_CHANGED_FILES`` (flagged with ``changed_files_truncated``): long
+    descriptions and huge file lists dominate input tokens while adding
+    little to a one-sentence summary, and the opening paragraph plus the
+    first files are usually enough to infer intent.
+
     Returns:
         ``{repo: {authored: [...], contributed: [...], reviewed: [...], waiting_for_review: [...]}}``
         Only non-empty categories are included per repo.
     """
     authored_prs, reviewed_prs, waiting_prs = _dedup_pr_lists(report)
-    repos: dict[str, dict[str, list[dict]]] = defaultdict(lambda: defaultdict(list))
+    repos: dict[str, dict[str, list[dict]]] = {}
 
     for pr in authored_prs:
         category = "contributed" if pr.contributed else "authored"
@@ -899,10 +1424,12 @@ def _build_repos_data(report: ReportData) -> dict[str, dict[str, list[dict]]]:
             "deletions": pr.deletions,
         }
         if pr.body:
-            entry["body"] = pr.body
+            entry["body"] = pr.body[:_MAX_BODY_CHARS]
         if pr.changed_files:
-            entry["changed_files"] = pr.changed_files
-        repos[pr.repo][category].append(entry)
+            entry["changed_files"] = pr.changed_files[:_MAX_CHANGED_FILES]
+            if len(pr.changed_files) > _MAX_CHANGED_FILES:
+                entry["changed_files_truncated"] = True
+        repos.setdefault(pr.repo, {}).setdefault(category, []).append(entry)
 
     for pr in reviewed_prs:
         entry = {
@@ -911,16 +1438,17 @@ def _build_repos_data(report: ReportData) -> dict[str, dict[str, list[dict]]]:
             "status": pr.status,
         }
         if pr.body:
-            entry["body"] = pr.body
+            entry["body"] = pr.body[:_MAX_BODY_CHARS]
         if pr.changed_files:
-            entry["changed_files"] = pr.changed_files
-        repos[pr.repo]["reviewed"].append(entry)
+            entry["changed_files"] = pr.changed_files[:_MAX_CHANGED_FILES]
+            if len(pr.changed_files) > _MAX_CHANGED_FILES:
+                entry["changed_files_truncated"] = True
+        repos.setdefault(pr.repo, {}).setdefault("reviewed", []).append(entry)
 
     for pr in waiting_prs:
-        repos[pr.repo]["waiting_for_review"].append({
+        repos.setdefault(pr.repo, {}).setdefault("waiting_for_review", []).append({
             "number": pr.number,
             "title": pr.title,
         })
 
-    # Convert nested defaultdicts to plain dicts for clean JSON serialization
-    return {repo: dict(categories) for repo, categories in repos.items()}
+    return repos
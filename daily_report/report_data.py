@@ -2,9 +2,14 @@
 
 from __future__ import annotations
 
+import sys
 from dataclasses import dataclass, field
 from typing import List, Optional
 
+# Per-item render structures are created once per PR; drop their __dict__
+# where supported (dataclass slots need Python 3.10+).
+_DATACLASS_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
 
 @dataclass
 class AuthoredPR:
@@ -56,7 +61,7 @@ class SummaryStats:
     ai_summary: str = ""     # AI-generated summary; replaces default when set
 
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class ContentItem:
     """A single renderable item with semantic fields. Formatters read fields and render."""
     title: str
@@ -69,14 +74,14 @@ class ContentItem:
     days_waiting: int = 0
 
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class ContentBlock:
     """A group of items under a heading (e.g. 'Worked on')."""
     heading: str
     items: List[ContentItem] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class RepoContent:
     """All content blocks for a single repository."""
     repo_name: str
@@ -18,6 +18,8 @@ import pytest
 import daily_report.content as _content_module
 from daily_report.content import (
     CONSOLIDATION_TOOLS,
+    _GIT_DIFF_OPTIONS,
+    _GIT_LOG_OPTIONS,
     _build_repos_data,
     _dedup_pr_lists,
     _exec_gh_pr_diff,
@@ -26,6 +28,8 @@ from daily_report.content import (
     _exec_git_log,
     _execute_tool,
     _load_prompt,
+    _parse_git_args,
+    _retry_with_backoff,
     _truncate,
     prepare_ai_summary,
     prepare_consolidated_content,
@@ -45,11 +49,27 @@ from daily_report.report_data import (
 
 
 @pytest.fixture(autouse=True)
-def _clear_caches():
-    """Reset the prompt cache before each test."""
+def _clear_caches(tmp_path, monkeypatch):
+    """Reset the prompt, module and client caches and isolate the response cache."""
+    monkeypatch.setenv("DAILY_REPORT_CACHE_DIR", str(tmp_path / "cache"))
+    for name in (
+        "DAILY_REPORT_CACHE_TTL", "DAILY_REPORT_NO_CACHE",
+        "DAILY_REPORT_BATCH", "DAILY_REPORT_LOCAL_SUMMARY", "DAILY_REPORT_TRIVIAL_MAX_PRS",
+    ):
+        monkeypatch.delenv(name, raising=False)
     _content_module._prompt_cache.clear()
+    _content_module._get_anthropic_client.cache_clear()
+    _content_module._anthropic = None
+    _content_module._claude_agent_sdk = None
+    _content_module._orjson = None
+    _content_module._orjson_checked = False
     yield
     _content_module._prompt_cache.clear()
+    _content_module._get_anthropic_client.cache_clear()
+    _content_module._anthropic = None
+    _content_module._claude_agent_sdk = None
+    _content_module._orjson = None
+    _content_module._orjson_checked = False
 
 
 # ---------------------------------------------------------------------------
@@ -67,6 +87,26 @@ def _make_mock_anthropic():
             setattr(self, "body", body),
         )[-1],
     })
+    mock_module.APIConnectionError = type("APIConnectionError", (mock_module.APIError,), {})
+    mock_module.APITimeoutError = type(
+        "APITimeoutError", (mock_module.APIConnectionError,), {},
+    )
+
+    class APIStatusError(mock_module.APIError):
+        status_code = None
+
+        def __init__(self, message="", status_code=None):
+            super().__init__(message)
+            if status_code is not None:
+                self.status_code = status_code
+
+    mock_module.APIStatusError = APIStatusError
+    for name, status in (
+        ("BadRequestError", 400), ("RateLimitError", 429), ("InternalServerError", 500),
+    ):
+        setattr(mock_module, name, type(name, (mock_module.APIStatusError,), {
+            "status_code": status,
+        }))
     return mock_module
 
 
@@ -92,6 +132,30 @@ def _make_report(**kwargs) -> ReportData:
     return ReportData(**defaults)
 
 
+def _make_busy_report() -> ReportData:
+    """Create a report large enough to not be short-circuited locally."""
+    return _make_report(
+        authored_prs=[
+            AuthoredPR(
+                repo="org/alpha", title="Add login", number=10,
+                status="Open", additions=50, deletions=10,
+                contributed=False, original_author=None,
+            ),
+            AuthoredPR(
+                repo="org/alpha", title="Add logout", number=11,
+                status="Merged", additions=20, deletions=5,
+                contributed=False, original_author=None,
+            ),
+        ],
+        reviewed_prs=[
+            ReviewedPR(repo="org/beta", title="Fix cache", number=20,
+                       author="alice", status="Merged"),
+            ReviewedPR(repo="org/beta", title="Bump deps", number=21,
+                       author="bob", status="Open"),
+        ],
+    )
+
+
 # ---------------------------------------------------------------------------
 # prepare_default_content tests
 # ---------------------------------------------------------------------------
@@ -364,80 +428,115 @@ class TestToolExecutors:
         mock_run.return_value = MagicMock(
             returncode=0, stdout='{"title":"Test PR"}', stderr="",
         )
-        result = _exec_gh_pr_view("org/repo", 42)
+        result, is_error = _exec_gh_pr_view("org/repo", 42)
         assert '{"title":"Test PR"}' in result
+        assert is_error is False
         mock_run.assert_called_once()
         cmd = mock_run.call_args[0][0]
         assert "gh" in cmd
         assert "42" in cmd
         assert "org/repo" in cmd
 
+    @patch("daily_report.content.subprocess.run")
+    def test_output_decoded_as_utf8_with_replacement(self, mock_run):
+        mock_run.return_value = MagicMock(returncode=0, stdout="ok", stderr="")
+        _exec_gh_pr_diff("org/repo", 1)
+        kwargs = mock_run.call_args[1]
+        assert kwargs["encoding"] == "utf-8"
+        assert kwargs["errors"] == "replace"
+
+    def test_invalid_utf8_output_replaced(self, tmp_path):
+        script = tmp_path / "emit.py"
+        script.write_text("import sys; sys.stdout.buffer.write(b'caf\\xe9 \\xff')")
+        result = _content_module._run_tool_cmd([sys.executable, str(script)])
+        assert result == ("caf\ufffd \ufffd", False)
+
     @patch("daily_report.content.subprocess.run")
     def test_gh_pr_view_error(self, mock_run):
         mock_run.return_value = MagicMock(
             returncode=1, stdout="", stderr="not found",
         )
-        result = _exec_gh_pr_view("org/repo", 999)
+        result, is_error = _exec_gh_pr_view("org/repo", 999)
         assert "Error" in result
+        assert is_error is True
 
     @patch("daily_report.content.subprocess.run")
     def test_gh_pr_view_timeout(self, mock_run):
         mock_run.side_effect = subprocess.TimeoutExpired(cmd="gh", timeout=30)
-        result = _exec_gh_pr_view("org/repo", 1)
+        result, is_error = _exec_gh_pr_view("org/repo", 1)
         assert "Error" in result
+        assert is_error is True
 
     @patch("daily_report.content.subprocess.run")
     def test_gh_pr_diff_success(self, mock_run):
         mock_run.return_value = MagicMock(
             returncode=0, stdout="diff --git a/f.py b/f.py\n+new line", stderr="",
         )
-        result = _exec_gh_pr_diff("org/repo", 10)
+        result, is_error = _exec_gh_pr_diff("org/repo", 10)
         assert "diff --git" in result
+        assert is_error is False
 
     @patch("daily_report.content.subprocess.run")
     def test_gh_pr_diff_error(self, mock_run):
         mock_run.return_value = MagicMock(
             returncode=1, stdout="", stderr="permission denied",
         )
-        result = _exec_gh_pr_diff("org/repo", 10)
+        result, is_error = _exec_gh_pr_diff("org/repo", 10)
         assert "Error" in result
+        assert is_error is True
 
     @patch("daily_report.content.subprocess.run")
     def test_git_log_success(self, mock_run):
         mock_run.return_value = MagicMock(
             returncode=0, stdout="abc1234 Initial commit", stderr="",
         )
-        result = _exec_git_log("org/repo", "--oneline -5", {"org/repo": "/tmp/repo"})
+        result, is_error = _exec_git_log("org/repo", "--oneline -5", {"org/repo": "/tmp/repo"})
         assert "abc1234" in result
+        assert is_error is False
         cmd = mock_run.call_args[0][0]
         assert "-C" in cmd
         assert "/tmp/repo" in cmd
 
+    @patch("daily_report.content.subprocess.run")
+    def test_output_starting_with_error_is_not_an_error(self, mock_run):
+        mock_run.return_value = MagicMock(
+            returncode=0, stdout="Error: handle nil config", stderr="",
+        )
+        result, is_error = _exec_git_log(
+            "org/repo", "-n1 --format=%s", {"org/repo": "/tmp/repo"},
+        )
+        assert result == "Error: handle nil config"
+        assert is_error is False
+
     @patch("daily_report.content.subprocess.run")
     def test_git_log_no_local_path(self, mock_run):
-        result = _exec_git_log("org/repo", "--oneline", {})
+        result, is_error = _exec_git_log("org/repo", "--oneline", {})
         assert "Error" in result
+        assert is_error is True
         assert "no local path" in result
         mock_run.assert_not_called()
 
     @patch("daily_report.content.subprocess.run")
     def test_git_log_timeout(self, mock_run):
         mock_run.side_effect = subprocess.TimeoutExpired(cmd="git", timeout=30)
-        result = _exec_git_log("org/repo", "--oneline", {"org/repo": "/tmp/repo"})
+        result, is_error = _exec_git_log("org/repo", "--oneline", {"org/repo": "/tmp/repo"})
         assert "Error" in result
+        assert is_error is True
 
     @patch("daily_report.content.subprocess.run")
     def test_git_diff_success(self, mock_run):
         mock_run.return_value = MagicMock(
             returncode=0, stdout="diff output here", stderr="",
         )
-        result = _exec_git_diff("org/repo", "HEAD~1", {"org/repo": "/tmp/repo"})
+        result, is_error = _exec_git_diff("org/repo", "HEAD~1", {"org/repo": "/tmp/repo"})
         assert "diff output here" in result
+        assert is_error is False
 
     @patch("daily_report.content.subprocess.run")
     def test_git_diff_no_local_path(self, mock_run):
-        result = _exec_git_diff("org/repo", "HEAD~1", {})
+        result, is_error = _exec_git_diff("org/repo", "HEAD~1", {})
         assert "Error" in result
+        assert is_error is True
         mock_run.assert_not_called()
 
     @patch("daily_report.content.subprocess.run")
@@ -445,8 +544,9 @@ class TestToolExecutors:
         mock_run.return_value = MagicMock(
             returncode=1, stdout="", stderr="fatal: bad revision",
         )
-        result = _exec_git_diff("org/repo", "bad..ref", {"org/repo": "/tmp/repo"})
+        result, is_error = _exec_git_diff("org/repo", "bad..ref", {"org/repo": "/tmp/repo"})
         assert "Error" in result
+        assert is_error is True
 
     @patch("daily_report.content.subprocess.run")
     def test_gh_pr_view_truncates_long_output(self, mock_run):
@@ -454,10 +554,79 @@ class TestToolExecutors:
         mock_run.return_value = MagicMock(
             returncode=0, stdout=long_output, stderr="",
         )
-        result = _exec_gh_pr_view("org/repo", 1)
+        result, is_error = _exec_gh_pr_view("org/repo", 1)
         assert "truncated" in result
+        assert is_error is False
         assert len(result) < 20000
 
+    @patch("daily_report.content.subprocess.run")
+    def test_git_log_rejects_disallowed_option(self, mock_run):
+        result, is_error = _exec_git_log("org/repo", "--output=/tmp/x", {"org/repo": "/tmp/repo"})
+        assert result.startswith("Error parsing args")
+        assert is_error is True
+        assert "--output" in result
+        mock_run.assert_not_called()
+
+    @patch("daily_report.content.subprocess.run")
+    def test_git_diff_rejects_paths_outside_repo(self, mock_run):
+        result, is_error = _exec_git_diff(
+            "org/repo", "/etc/hostname /dev/null", {"org/repo": "/tmp/repo"},
+        )
+        assert result.startswith("Error parsing args")
+        assert is_error is True
+        mock_run.assert_not_called()
+
+    @patch("daily_report.content.subprocess.run")
+    def test_git_diff_rejects_no_index(self, mock_run):
+        result, is_error = _exec_git_diff(
+            "org/repo", "--no-index /etc/passwd /dev/null", {"org/repo": "/tmp/repo"},
+        )
+        assert result.startswith("Error parsing args")
+        assert is_error is True
+        mock_run.assert_not_called()
+
+
+class TestParseGitArgs:
+    """Tests for the git log/diff argument allowlist."""
+
+    def test_accepts_numeric_count_and_oneline(self):
+        assert _parse_git_args("--oneline -20", _GIT_LOG_OPTIONS) == ["--oneline", "-20"]
+
+    def test_keeps_quoted_values_and_revisions(self):
+        assert _parse_git_args('--author="Jane Doe" -n 5 main..HEAD', _GIT_LOG_OPTIONS) == [
+            "--author=Jane Doe", "-n", "5", "main..HEAD",
+        ]
+
+    def test_accepts_attached_short_values(self):
+        assert _parse_git_args("HEAD~5..HEAD --stat -U3", _GIT_DIFF_OPTIONS) == [
+            "HEAD~5..HEAD", "--stat", "-U3",
+        ]
+
+    def test_options_after_double_dash_not_checked(self):
+        assert _parse_git_args("HEAD -- --weird-file", _GIT_DIFF_OPTIONS) == [
+            "HEAD", "--", "--weird-file",
+        ]
+
+    @pytest.mark.parametrize("args", [
+        "/etc/hostname /dev/null", "HEAD -- ../secret", "HEAD -- src/../../x", "..",
+    ])
+    def test_rejects_paths_outside_repo(self, args):
+        with pytest.raises(ValueError, match="outside the repository"):
+            _parse_git_args(args, _GIT_DIFF_OPTIONS)
+
+    @pytest.mark.parametrize("args", ["--output=out.txt", "--ext-diff", "-c", "--exec=sh"])
+    def test_rejects_unknown_options(self, args):
+        with pytest.raises(ValueError, match="not allowed"):
+            _parse_git_args(args, _GIT_DIFF_OPTIONS)
+
+    def test_log_only_option_rejected_for_diff(self):
+        with pytest.raises(ValueError):
+            _parse_git_args("-n5", _GIT_DIFF_OPTIONS)
+
+    def test_unbalanced_quotes_raise(self):
+        with pytest.raises(ValueError):
+            _parse_git_args('--author="Jane', _GIT_LOG_OPTIONS)
+
 
 # ---------------------------------------------------------------------------
 # _execute_tool tests
@@ -466,49 +635,49 @@ class TestToolExecutors:
 class TestExecuteTool:
     """Tests for _execute_tool dispatcher."""
 
-    @patch("daily_report.content._exec_gh_pr_view", return_value="pr view output")
+    @patch("daily_report.content._exec_gh_pr_view", return_value=("pr view output", False))
     def test_dispatches_gh_pr_view(self, mock_exec):
         result = _execute_tool("gh_pr_view", {"repo": "org/repo", "number": 1}, {})
-        assert result == "pr view output"
+        assert result == ("pr view output", False)
         mock_exec.assert_called_once_with("org/repo", 1)
 
-    @patch("daily_report.content._exec_gh_pr_diff", return_value="pr diff output")
+    @patch("daily_report.content._exec_gh_pr_diff", return_value=("pr diff output", False))
     def test_dispatches_gh_pr_diff(self, mock_exec):
         result = _execute_tool("gh_pr_diff", {"repo": "org/repo", "number": 5}, {})
-        assert result == "pr diff output"
+        assert result == ("pr diff output", False)
         mock_exec.assert_called_once_with("org/repo", 5)
 
-    @patch("daily_report.content._exec_git_log", return_value="git log output")
+    @patch("daily_report.content._exec_git_log", return_value=("git log output", False))
     def test_dispatches_git_log(self, mock_exec):
         paths = {"org/repo": "/tmp/repo"}
         result = _execute_tool("git_log", {"repo": "org/repo", "args": "--oneline"}, paths)
-        assert result == "git log output"
+        assert result == ("git log output", False)
         mock_exec.assert_called_once_with("org/repo", "--oneline", paths)
 
-    @patch("daily_report.content._exec_git_log", return_value="default log")
+    @patch("daily_report.content._exec_git_log", return_value=("default log", False))
     def test_git_log_default_args(self, mock_exec):
         paths = {"org/repo": "/tmp/repo"}
         result = _execute_tool("git_log", {"repo": "org/repo"}, paths)
-        assert result == "default log"
+        assert result == ("default log", False)
         mock_exec.assert_called_once_with("org/repo", "--oneline -20", paths)
 
-    @patch("daily_report.content._exec_git_diff", return_value="git diff output")
+    @patch("daily_report.content._exec_git_diff", return_value=("git diff output", False))
     def test_dispatches_git_diff(self, mock_exec):
         paths = {"org/repo": "/tmp/repo"}
         result = _execute_tool("git_diff", {"repo": "org/repo", "args": "HEAD~3"}, paths)
-        assert result == "git diff output"
+        assert result == ("git diff output", False)
         mock_exec.assert_called_once_with("org/repo", "HEAD~3", paths)
 
-    @patch("daily_report.content._exec_git_diff", return_value="default diff")
+    @patch("daily_report.content._exec_git_diff", return_value=("default diff", False))
     def test_git_diff_default_args(self, mock_exec):
         paths = {"org/repo": "/tmp/repo"}
         result = _execute_tool("git_diff", {"repo": "org/repo"}, paths)
-        assert result == "default diff"
+        assert result == ("default diff", False)
         mock_exec.assert_called_once_with("org/repo", "HEAD~1", paths)
 
     def test_unknown_tool_returns_error(self):
-        result = _execute_tool("nonexistent_tool", {}, {})
-        assert "Error" in result
+        result, is_error = _execute_tool("nonexistent_tool", {}, {})
+        assert is_error is True
         assert "unknown tool" in result
 
 
@@ -567,7 +736,7 @@ class TestCallViaSdkWithTools:
             self._make_text_response("# Consolidated Report"),
         ]
 
-        with patch("daily_report.content._execute_tool", return_value="tool output"):
+        with patch("daily_report.content._execute_tool", return_value=("tool output", False)):
             result = self._call("sk-test", "model", "system", "user msg", CONSOLIDATION_TOOLS, {})
 
         assert result == "# Consolidated Report"
@@ -581,7 +750,7 @@ class TestCallViaSdkWithTools:
             self._make_text_response("# Final Report"),
         ]
 
-        with patch("daily_report.content._execute_tool", return_value="tool output"):
+        with patch("daily_report.content._execute_tool", return_value=("tool output", False)):
             result = self._call("sk-test", "model", "system", "user msg", CONSOLIDATION_TOOLS, {})
 
         assert result == "# Final Report"
@@ -594,7 +763,7 @@ class TestCallViaSdkWithTools:
             "gh_pr_view", {"repo": "org/repo", "number": 1},
         )
 
-        with patch("daily_report.content._execute_tool", return_value="output"):
+        with patch("daily_report.content._execute_tool", return_value=("output", False)):
             with pytest.raises(RuntimeError, match="exceeded.*tool-use turns"):
                 self._call("sk-test", "model", "system", "user", CONSOLIDATION_TOOLS, {}, max_turns=3)
 
@@ -625,6 +794,421 @@ class TestCallViaSdkWithTools:
         result = self._call("sk-test", "model", "system", "user", [], {})
         assert result == "partial result"
 
+    def test_tool_results_flag_errors_and_move_cache_breakpoint(self):
+        import copy
+        client = self._mock_anthropic.Anthropic.return_value
+        responses = iter([
+            self._make_tool_use_response("git_log", {"repo": "org/repo"}, "t1"),
+            self._make_tool_use_response("gh_pr_view", {"repo": "org/repo", "number": 1}, "t2"),
+            self._make_text_response("# Final"),
+        ])
+        sent: list[list[dict]] = []
+
+        def _create(**kwargs):
+            sent.append(copy.deepcopy(kwargs["messages"]))
+            return next(responses)
+
+        client.messages.create.side_effect = _create
+        with patch(
+            "daily_report.content._execute_tool",
+            side_effect=[
+                ("Error: no local path for repo 'org/repo'", True),
+                ('{"title": "PR"}', False),
+            ],
+        ):
+            self._call("sk-test", "model", "system", "user msg", CONSOLIDATION_TOOLS, {})
+
+        second_turn_result = sent[1][2]["content"][0]
+        assert second_turn_result["is_error"] is True
+        assert second_turn_result["cache_control"] == {"type": "ephemeral"}
+
+        first_result, second_result = sent[2][2]["content"][0], sent[2][4]["content"][0]
+        assert "cache_control" not in first_result
+        assert second_result["is_error"] is False
+        assert second_result["cache_control"] == {"type": "ephemeral"}
+
+    def test_rate_limit_error_is_retried(self):
+        client = self._mock_anthropic.Anthropic.return_value
+        client.messages.create.side_effect = [
+            self._mock_anthropic.RateLimitError(message="429"),
+            self._make_text_response("# Recovered"),
+        ]
+
+        with patch("daily_report.content.time.sleep") as mock_sleep:
+            result = self._call("sk-test", "model", "system", "user", [], {})
+
+        assert result == "# Recovered"
+        assert client.messages.create.call_count == 2
+        mock_sleep.assert_called_once()
+
+    def test_overloaded_error_is_retried(self):
+        client = self._mock_anthropic.Anthropic.return_value
+        client.messages.create.side_effect = [
+            self._mock_anthropic.APIStatusError(message="Overloaded", status_code=529),
+            self._make_text_response("# Recovered"),
+        ]
+
+        with patch("daily_report.content.time.sleep") as mock_sleep:
+            result = self._call("sk-test", "model", "system", "user", [], {})
+
+        assert result == "# Recovered"
+        assert client.messages.create.call_count == 2
+        mock_sleep.assert_called_once()
+
+    def test_timeout_is_not_retried(self):
+        client = self._mock_anthropic.Anthropic.return_value
+        client.messages.create.side_effect = self._mock_anthropic.APITimeoutError(
+            message="Request timed out.",
+        )
+
+        with patch("daily_report.content.time.sleep") as mock_sleep:
+            with pytest.raises(RuntimeError, match="Claude API call failed"):
+                self._call("sk-test", "model", "system", "user", [], {})
+
+        assert client.messages.create.call_count == 1
+        mock_sleep.assert_not_called()
+
+    def test_client_error_is_not_retried(self):
+        client = self._mock_anthropic.Anthropic.return_value
+        client.messages.create.side_effect = self._mock_anthropic.BadRequestError(
+            message="bad request",
+        )
+
+        with patch("daily_report.content.time.sleep") as mock_sleep:
+            with pytest.raises(RuntimeError, match="Claude API call failed"):
+                self._call("sk-test", "model", "system", "user", [], {})
+
+        assert client.messages.create.call_count == 1
+        mock_sleep.assert_not_called()
+
+    def test_client_reused_across_calls(self):
+        client = self._mock_anthropic.Anthropic.return_value
+        client.messages.create.return_value = self._make_text_response("done")
+
+        self._call("sk-test", "model", "system", "user", [], {})
+        self._call("sk-test", "model", "system", "user", [], {})
+
+        assert self._mock_anthropic.Anthropic.call_count == 1
+        assert client.messages.create.call_count == 2
+
+
+# ---------------------------------------------------------------------------
+# _call_via_sdk tests
+# ---------------------------------------------------------------------------
+
+class TestCallViaSdk:
+    """Tests for the single-shot SDK call (no tools)."""
+
+    @pytest.fixture(autouse=True)
+    def _install_mock_anthropic(self):
+        self._mock_anthropic = _make_mock_anthropic()
+        with patch.dict(sys.modules, {"anthropic": self._mock_anthropic}):
+            yield
+
+    def _set_response(self, text: str) -> MagicMock:
+        block = MagicMock()
+        block.type = "text"
+        block.text = text
+        client = self._mock_anthropic.Anthropic.return_value
+        client.messages.create.return_value = MagicMock(
+            content=[block], stop_reason="end_turn",
+            usage=MagicMock(input_tokens=10, output_tokens=5, cache_read_input_tokens=0),
+        )
+        return client
+
+    def test_returns_text(self):
+        self._set_response("Short summary.")
+        result = _content_module._call_via_sdk("sk-test", "model", "system", "user")
+        assert result == "Short summary."
+
+    def test_system_prompt_marked_cacheable(self):
+        client = self._set_response("ok")
+        system_prompt = [
+            {"type": "text", "text": "Behaviour"},
+            {"type": "text", "text": "Format"},
+        ]
+        _content_module._call_via_sdk("sk-test", "model", system_prompt, "user")
+
+        system = client.messages.create.call_args[1]["system"]
+        assert "cache_control" not in system[0]
+        assert system[1] == {
+            "type": "text", "text": "Format", "cache_control": {"type": "ephemeral"},
+        }
+        # Caller's blocks are not mutated
+        assert "cache_control" not in system_prompt[1]
+
+    def test_user_message_marked_cacheable(self):
+        client = self._set_response("ok")
+        _content_module._call_via_sdk("sk-test", "model", "system", '{"org/a":{}}')
+
+        messages = client.messages.create.call_args[1]["messages"]
+        assert messages == [{
+            "role": "user",
+            "content": [{
+                "type": "text", "text": '{"org/a":{}}',
+                "cache_control": {"type": "ephemeral"},
+            }],
+        }]
+
+
+class TestCacheableSystem:
+    """Tests for converting system prompts to cacheable blocks."""
+
+    def test_string_becomes_single_cached_block(self):
+        assert _content_module._cacheable_system("Be brief.") == [
+            {"type": "text", "text": "Be brief.", "cache_control": {"type": "ephemeral"}},
+        ]
+
+    def test_only_last_block_marked(self):
+        blocks = _content_module._cacheable_system([
+            {"type": "text", "text": "a"}, {"type": "text", "text": "b"},
+        ])
+        assert [("cache_control" in b) for b in blocks] == [False, True]
+
+
+class TestCallViaBatch:
+    """Tests for the Message Batches backend."""
+
+    @pytest.fixture(autouse=True)
+    def _install_mock_anthropic(self):
+        self._mock_anthropic = _make_mock_anthropic()
+        with patch.dict(sys.modules, {"anthropic": self._mock_anthropic}), \
+                patch("daily_report.content.time.sleep") as self._sleep:
+            yield
+
+    @staticmethod
+    def _entry(custom_id: str, text: str = "", result_type: str = "succeeded") -> MagicMock:
+        block = MagicMock()
+        block.type = "text"
+        block.text = text
+        entry = MagicMock()
+        entry.custom_id = custom_id
+        entry.result.type = result_type
+        entry.result.message.content = [block]
+        return entry
+
+    def _batches(self) -> MagicMock:
+        batches = self._mock_anthropic.Anthropic.return_value.messages.batches
+        batches.create.return_value = MagicMock(id="b1", processing_status="in_progress")
+        batches.retrieve.side_effect = [
+            MagicMock(id="b1", processing_status="in_progress"),
+            MagicMock(id="b1", processing_status="ended"),
+        ]
+        return batches
+
+    def test_polls_until_ended_and_returns_texts(self):
+        batches = self._batches()
+        batches.results.return_value = [self._entry("a", "A"), self._entry("b", "B")]
+
+        result = _content_module._call_via_batch(
+            "sk-test", {"a": {"model": "m"}, "b": {"model": "m"}}, poll_interval=0.5,
+        )
+
+        assert result == {"a": "A", "b": "B"}
+        assert batches.create.call_args[1]["requests"] == [
+            {"custom_id": "a", "params": {"model": "m"}},
+            {"custom_id": "b", "params": {"model": "m"}},
+        ]
+        assert batches.retrieve.call_count == 2
+        assert self._sleep.call_args_list == [call(0.5), call(0.5)]
+        batches.results.assert_called_once_with("b1")
+
+    def test_errored_request_raises_runtime_error(self):
+        batches = self._batches()
+        batches.results.return_value = [self._entry("a", result_type="errored")]
+
+        with pytest.raises(RuntimeError, match="'a' errored"):
+            _content_module._call_via_batch("sk-test", {"a": {}})
+
+    def test_missing_result_raises_runtime_error(self):
+        batches = self._batches()
+        batches.results.return_value = []
+
+        with pytest.raises(RuntimeError, match="no result"):
+            _content_module._call_via_batch("sk-test", {"a": {}})
+
+    def test_api_error_wrapped(self):
+        batches = self._batches()
+        batches.create.side_effect = self._mock_anthropic.APIError("bad request")
+
+        with pytest.raises(RuntimeError, match="batch API call failed"):
+            _content_module._call_via_batch("sk-test", {"a": {}})
+
+    def test_call_backend_routes_to_batch_when_enabled(self, monkeypatch):
+        monkeypatch.setenv("DAILY_REPORT_BATCH", "1")
+        with patch("daily_report.content._call_via_batch",
+                   return_value={"request": "batched"}) as mock_batch, \
+                patch("daily_report.content._call_via_sdk") as mock_sdk:
+            result = _content_module._call_backend("sk-test", "model", "sys", "user")
+
+        assert result == "batched"
+        mock_sdk.assert_not_called()
+        params = mock_batch.call_args[0][1]["request"]
+        assert params["model"] == "model"
+        assert params["system"][-1]["cache_control"] == {"type": "ephemeral"}
+
+    def test_call_backend_ignores_batch_without_api_key(self, monkeypatch):
+        monkeypatch.setenv("DAILY_REPORT_BATCH", "1")
+        with patch("daily_report.content._call_via_batch") as mock_batch, \
+                patch("daily_report.content._call_via_sdk_agent", return_value="agent"):
+            result = _content_module._call_backend(None, "model", "sys", "user")
+
+        assert result == "agent"
+        mock_batch.assert_not_called()
+
+
+class TestDumpsCompact:
+    """Tests for compact JSON serialization of the summary payload."""
+
+    _DATA = {"b": [1, {"y": "é", "x": None}], "a": {}}
+
+    def test_compact_and_sorted(self):
+        text = _content_module._dumps_compact(self._DATA)
+        assert text == '{"a":{},"b":[1,{"x":null,"y":"é"}]}'
+
+    def test_stdlib_fallback_without_orjson(self):
+        with patch("daily_report.content._get_orjson", return_value=None):
+            text = _content_module._dumps_compact(self._DATA)
+        assert text == '{"a":{},"b":[1,{"x":null,"y":"é"}]}'
+
+
+# ---------------------------------------------------------------------------
+# _extract_text tests
+# ---------------------------------------------------------------------------
+
+class TestExtractText:
+    """Tests for joining text blocks from a Messages API response."""
+
+    @staticmethod
+    def _block(type_: str, text: str = "") -> MagicMock:
+        block = MagicMock()
+        block.type = type_
+        block.text = text
+        return block
+
+    def test_joins_text_blocks_in_order(self):
+        content = [self._block("text", "# A\n"), self._block("text", "- b")]
+        assert _content_module._extract_text(content) == "# A\n- b"
+
+    def test_skips_non_text_blocks(self):
+        content = [
+            self._block("text", "before "),
+            self._block("tool_use", "ignored"),
+            self._block("text", "after"),
+        ]
+        assert _content_module._extract_text(content) == "before after"
+
+    def test_empty_content(self):
+        assert _content_module._extract_text([]) == ""
+
+
+# ---------------------------------------------------------------------------
+# Lazy module import tests
+# ---------------------------------------------------------------------------
+
+class TestLazyModuleImports:
+    """The optional SDK modules are imported once and then reused."""
+
+    def test_anthropic_module_cached(self):
+        mock_module = _make_mock_anthropic()
+        with patch.dict(sys.modules, {"anthropic": mock_module}):
+            first = _content_module._get_anthropic()
+        # Cached: no longer depends on sys.modules
+        assert _content_module._get_anthropic() is first is mock_module
+
+    def test_claude_agent_sdk_module_cached(self):
+        mock_sdk = MagicMock()
+        with patch.dict(sys.modules, {"claude_agent_sdk": mock_sdk}):
+            first = _content_module._get_claude_agent_sdk()
+        assert _content_module._get_claude_agent_sdk() is first is mock_sdk
+
+    def test_orjson_module_cached(self):
+        mock_orjson = MagicMock()
+        with patch.dict(sys.modules, {"orjson": mock_orjson}):
+            first = _content_module._get_orjson()
+        assert _content_module._get_orjson() is first is mock_orjson
+
+    def test_missing_orjson_returns_none(self):
+        with patch.dict(sys.modules, {"orjson": None}):
+            assert _content_module._get_orjson() is None
+
+    def test_missing_anthropic_raises_import_error(self):
+        with patch.dict(sys.modules, {"anthropic": None}):
+            with pytest.raises(ImportError, match="anthropic"):
+                _content_module._get_anthropic()
+
+
+# ---------------------------------------------------------------------------
+# _retry_with_backoff tests
+# ---------------------------------------------------------------------------
+
+class _Transient(Exception):
+    pass
+
+
+class TestRetryWithBackoff:
+    """Tests for the jittered exponential backoff helper."""
+
+    @patch("daily_report.content.time.sleep")
+    def test_returns_first_success(self, mock_sleep):
+        fn = MagicMock(return_value="ok")
+        assert _retry_with_backoff(fn, retry_on=(_Transient,)) == "ok"
+        assert fn.call_count == 1
+        mock_sleep.assert_not_called()
+
+    @patch("daily_report.content.random.random", return_value=0.0)
+    @patch("daily_report.content.time.sleep")
+    def test_delays_grow_exponentially_and_are_capped(self, mock_sleep, _rand):
+        fn = MagicMock(side_effect=[_Transient()] * 4 + ["ok"])
+        result = _retry_with_backoff(fn, retry_on=(_Transient,), tries=5, base=1.0, cap=3.0)
+        assert result == "ok"
+        assert [c.args[0] for c in mock_sleep.call_args_list] == [1.0, 2.0, 3.0, 3.0]
+
+    @patch("daily_report.content.time.sleep")
+    def test_reraises_after_last_attempt(self, mock_sleep):
+        fn = MagicMock(side_effect=_Transient("boom"))
+        with pytest.raises(_Transient, match="boom"):
+            _retry_with_backoff(fn, retry_on=(_Transient,), tries=3)
+        assert fn.call_count == 3
+        assert mock_sleep.call_count == 2
+
+    @pytest.mark.parametrize("status, expected", [
+        (None, True), (408, True), (409, True), (429, True), (500, True), (529, True),
+        (400, False), (401, False), (404, False),
+    ])
+    def test_is_transient_error(self, status, expected):
+        error = _Transient()
+        if status is not None:
+            error.status_code = status
+        with patch.dict(sys.modules, {"anthropic": _make_mock_anthropic()}):
+            assert _content_module._is_transient_error(error) is expected
+
+    def test_timeout_not_transient(self):
+        mock_anthropic = _make_mock_anthropic()
+        with patch.dict(sys.modules, {"anthropic": mock_anthropic}):
+            assert not _content_module._is_transient_error(
+                mock_anthropic.APITimeoutError("timed out"),
+            )
+            assert _content_module._is_transient_error(
+                mock_anthropic.APIConnectionError("reset"),
+            )
+
+    @patch("daily_report.content.time.sleep")
+    def test_retry_if_rejects_error(self, mock_sleep):
+        fn = MagicMock(side_effect=_Transient("permanent"))
+        with pytest.raises(_Transient):
+            _retry_with_backoff(fn, retry_on=(_Transient,), retry_if=lambda e: False)
+        assert fn.call_count == 1
+        mock_sleep.assert_not_called()
+
+    @patch("daily_report.content.time.sleep")
+    def test_other_errors_not_retried(self, mock_sleep):
+        fn = MagicMock(side_effect=ValueError("bad"))
+        with pytest.raises(ValueError):
+            _retry_with_backoff(fn, retry_on=(_Transient,))
+        assert fn.call_count == 1
+        mock_sleep.assert_not_called()
+
 
 # ---------------------------------------------------------------------------
 # _call_via_sdk_agent_with_tools tests
@@ -699,15 +1283,7 @@ class TestPrepareConsolidatedContentViaSDK:
     """Tests using the SDK backend (ANTHROPIC_API_KEY set)."""
 
     def _report_with_prs(self) -> ReportData:
-        return _make_report(
-            authored_prs=[
-                AuthoredPR(
-                    repo="org/alpha", title="Add login", number=10,
-                    status="Open", additions=50, deletions=10,
-                    contributed=False, original_author=None,
-                ),
-            ],
-        )
+        return _make_busy_report()
 
     @patch.dict("os.environ", {"ANTHROPIC_API_KEY": "sk-test"}, clear=False)
     @patch("daily_report.content._call_backend_with_tools")
@@ -746,14 +1322,97 @@ class TestPrepareConsolidatedContentViaSDK:
 
     @patch.dict("os.environ", {"ANTHROPIC_API_KEY": "sk-test"}, clear=False)
     @patch("daily_report.content._call_backend_with_tools")
-    def test_empty_report_still_calls_backend(self, mock_backend):
-        """Even an empty report generates 'No PR activity' markdown and sends it."""
-        mock_backend.return_value = "# Empty consolidated"
+    def test_empty_report_skips_backend(self, mock_backend):
+        """An empty report's 'No PR activity' markdown is returned as-is."""
         report = _make_report()
         result = prepare_consolidated_content(report)
         # format_markdown produces non-empty output even for empty reports
         # (it includes the title and "No PR activity found" text)
         assert isinstance(result, str)
+        assert result
+        mock_backend.assert_not_called()
+
+    @patch.dict("os.environ", {"ANTHROPIC_API_KEY": "sk-test"}, clear=False)
+    @patch("daily_report.content._call_backend_with_tools")
+    @patch("daily_report.format_markdown.format_markdown", return_value="# Input MD\n")
+    def test_trivial_single_repo_report_skips_backend(self, mock_fmt, mock_backend):
+        report = _make_report(
+            authored_prs=[
+                AuthoredPR(
+                    repo="org/alpha", title="Add login", number=10,
+                    status="Open", additions=50, deletions=10,
+                    contributed=False, original_author=None,
+                ),
+            ],
+        )
+        result = prepare_consolidated_content(report)
+        assert result == "# Input MD"
+        mock_backend.assert_not_called()
+
+    @patch.dict("os.environ", {"ANTHROPIC_API_KEY": "sk-test"}, clear=False)
+    @patch("daily_report.content._call_backend_with_tools")
+    @patch("daily_report.format_markdown.format_markdown", return_value="# Input MD\n")
+    def test_trivial_threshold_configurable(self, mock_fmt, mock_backend, monkeypatch):
+        monkeypatch.setenv("DAILY_REPORT_TRIVIAL_MAX_PRS", "0")
+        report = _make_report(
+            authored_prs=[
+                AuthoredPR(
+                    repo="org/alpha", title="Add login", number=10,
+                    status="Open", additions=50, deletions=10,
+                    contributed=False, original_author=None,
+                ),
+            ],
+        )
+        mock_backend.return_value = "# AI"
+        assert prepare_consolidated_content(report) == "# AI"
+        mock_backend.assert_called_once()
+
+        mock_backend.reset_mock()
+        monkeypatch.setenv("DAILY_REPORT_TRIVIAL_MAX_PRS", "10")
+        report = _make_report(authored_prs=[
+            AuthoredPR(
+                repo="org/alpha", title=f"PR {i}", number=i,
+                status="Open", additions=1, deletions=0,
+                contributed=False, original_author=None,
+            )
+            for i in range(8)
+        ])
+        assert prepare_consolidated_content(report) == "# Input MD"
+        mock_backend.assert_not_called()
+
+    @patch.dict("os.environ", {"ANTHROPIC_API_KEY": "sk-test"}, clear=False)
+    @patch("daily_report.content._call_backend_with_tools", return_value="# AI")
+    def test_custom_prompt_bypasses_trivial_shortcut(self, mock_backend):
+        report = _make_report(
+            authored_prs=[
+                AuthoredPR(
+                    repo="org/alpha", title="Add login", number=10,
+                    status="Open", additions=50, deletions=10,
+                    contributed=False, original_author=None,
+                ),
+            ],
+        )
+        assert prepare_consolidated_content(report, prompt="Custom") == "# AI"
+        assert mock_backend.call_args[0][2] == "Custom"
+
+    @patch.dict("os.environ", {"ANTHROPIC_API_KEY": "sk-test"}, clear=False)
+    @patch("daily_report.content._call_backend_with_tools", return_value="# AI")
+    def test_few_prs_across_repos_still_calls_backend(self, mock_backend):
+        report = _make_report(
+            authored_prs=[
+                AuthoredPR(
+                    repo="org/alpha", title="A", number=1,
+                    status="Open", additions=1, deletions=0,
+                    contributed=False, original_author=None,
+                ),
+            ],
+            reviewed_prs=[
+                ReviewedPR(repo="org/beta", title="B", number=2,
+                           author="alice", status="Open"),
+            ],
+        )
+        assert prepare_consolidated_content(report) == "# AI"
+        mock_backend.assert_called_once()
 
     @patch.dict("os.environ", {"ANTHROPIC_API_KEY": "sk-test"}, clear=False)
     @patch("daily_report.content._call_backend_with_tools")
@@ -782,15 +1441,7 @@ class TestPrepareConsolidatedContentViaSDKAgent:
     """Tests using the SDK agent backend (no ANTHROPIC_API_KEY)."""
 
     def _report_with_prs(self) -> ReportData:
-        return _make_report(
-            authored_prs=[
-                AuthoredPR(
-                    repo="org/alpha", title="Add login", number=10,
-                    status="Open", additions=50, deletions=10,
-                    contributed=False, original_author=None,
-                ),
-            ],
-        )
+        return _make_busy_report()
 
     @patch.dict("os.environ", {}, clear=False)
     @patch("daily_report.content._call_backend_with_tools")
@@ -834,15 +1485,7 @@ class TestPrepareAiSummary:
     """Tests for prepare_ai_summary."""
 
     def _report_with_prs(self) -> ReportData:
-        return _make_report(
-            authored_prs=[
-                AuthoredPR(
-                    repo="org/alpha", title="Add login", number=10,
-                    status="Open", additions=50, deletions=10,
-                    contributed=False, original_author=None,
-                ),
-            ],
-        )
+        return _make_busy_report()
 
     @patch.dict("os.environ", {}, clear=False)
     @patch("daily_report.content._call_via_sdk_agent")
@@ -865,6 +1508,92 @@ class TestPrepareAiSummary:
         result = prepare_ai_summary(_make_report())
         assert result == ""
 
+    @patch("daily_report.content._call_backend")
+    def test_trivial_report_uses_local_summary(self, mock_backend):
+        report = _make_report(
+            authored_prs=[
+                AuthoredPR(
+                    repo="org/alpha", title="Add login", number=10,
+                    status="Open", additions=50, deletions=10,
+                    contributed=False, original_author=None,
+                ),
+                AuthoredPR(
+                    repo="org/alpha", title="Add logout", number=11,
+                    status="Open", additions=5, deletions=1,
+                    contributed=False, original_author=None,
+                ),
+            ],
+            reviewed_prs=[
+                ReviewedPR(repo="org/beta", title="Fix", number=3,
+                           author="alice", status="Merged"),
+            ],
+        )
+        result = prepare_ai_summary(report)
+        assert result == "Worked on 2 PRs in org/alpha; reviewed 1 PR in org/beta."
+        mock_backend.assert_not_called()
+
+    @patch("daily_report.content._call_backend", return_value="AI summary")
+    def test_custom_prompt_bypasses_trivial_shortcut(self, mock_backend):
+        report = _make_report(
+            authored_prs=[
+                AuthoredPR(
+                    repo="org/alpha", title="Add login", number=10,
+                    status="Open", additions=50, deletions=10,
+                    contributed=False, original_author=None,
+                ),
+            ],
+        )
+        assert prepare_ai_summary(report, prompt="Custom") == "AI summary"
+        assert mock_backend.call_args[0][2] == "Custom"
+
+    @patch("daily_report.content._call_backend", return_value="AI")
+    def test_default_prompt_states_length_limit(self, mock_backend):
+        prepare_ai_summary(self._report_with_prs())
+        system_prompt = mock_backend.call_args[0][2]
+        assert "Max 160 characters." in system_prompt[-1]["text"]
+
+    @patch("daily_report.content._call_backend")
+    def test_trivial_threshold_configurable(self, mock_backend, monkeypatch):
+        monkeypatch.setenv("DAILY_REPORT_TRIVIAL_MAX_PRS", "4")
+        result = prepare_ai_summary(self._report_with_prs())
+        assert result == "Worked on 2 PRs in org/alpha; reviewed 2 PRs in org/beta."
+        mock_backend.assert_not_called()
+
+    @patch("daily_report.content._call_backend")
+    def test_raised_threshold_keeps_summary_short(self, mock_backend, monkeypatch):
+        monkeypatch.setenv("DAILY_REPORT_TRIVIAL_MAX_PRS", "50")
+        report = _make_report(
+            authored_prs=[
+                AuthoredPR(
+                    repo=f"org/service-{i:02d}", title="Change", number=i,
+                    status="Open", additions=1, deletions=0,
+                    contributed=False, original_author=None,
+                )
+                for i in range(8)
+            ],
+            reviewed_prs=[
+                ReviewedPR(repo=f"org/library-{i:02d}", title="Fix", number=100 + i,
+                           author="alice", status="Merged")
+                for i in range(5)
+            ],
+        )
+        result = prepare_ai_summary(report)
+        assert result == "8 authored, 5 reviewed, 0 awaiting review across 13 repos."
+        assert len(result) <= 160
+        mock_backend.assert_not_called()
+
+    @patch("daily_report.content._call_backend", return_value="AI")
+    def test_invalid_trivial_threshold_ignored(self, mock_backend, monkeypatch):
+        monkeypatch.setenv("DAILY_REPORT_TRIVIAL_MAX_PRS", "many")
+        assert prepare_ai_summary(self._report_with_prs()) == "AI"
+
+    @patch("daily_report.content._call_backend")
+    def test_local_summary_forced_by_env(self, mock_backend, monkeypatch):
+        monkeypatch.setenv("DAILY_REPORT_LOCAL_SUMMARY", "1")
+        result = prepare_ai_summary(self._report_with_prs())
+        assert result == "Worked on 2 PRs in org/alpha; reviewed 2 PRs in org/beta."
+        mock_backend.assert_not_called()
+
     @patch.dict("os.environ", {}, clear=False)
     @patch("daily_report.content._call_via_sdk_agent")
     def test_uses_custom_prompt(self, mock_agent, monkeypatch):
@@ -875,6 +1604,96 @@ class TestPrepareAiSummary:
         )
         assert result == "Custom summary."
 
+    @patch("daily_report.content._call_backend", return_value="ok")
+    def test_user_message_is_compact_sorted_json(self, mock_backend):
+        report = _make_busy_report()
+        prepare_ai_summary(report)
+
+        user_message = mock_backend.call_args[0][3]
+        assert json.loads(user_message) == _build_repos_data(report)
+        assert "\n" not in user_message
+
+
+class TestPrepareBoth:
+    """Tests for running consolidation and summary concurrently."""
+
+    @patch("daily_report.content.prepare_ai_summary", return_value="Summary.")
+    @patch("daily_report.content.prepare_consolidated_content", return_value="# Consolidated")
+    def test_returns_both_results(self, mock_consolidate, mock_summary):
+        report = _make_busy_report()
+        result = _content_module.prepare_both(
+            report, model="m", consolidate_prompt="cp", summary_prompt="sp",
+            group_by="project", repo_paths={"org/alpha": "/tmp/a"},
+        )
+        assert result == ("# Consolidated", "Summary.")
+        mock_consolidate.assert_called_once_with(
+            report, model="m", prompt="cp", group_by="project",
+            repo_paths={"org/alpha": "/tmp/a"},
+        )
+        mock_summary.assert_called_once_with(report, model="m", prompt="sp")
+
+    @patch("daily_report.content.prepare_ai_summary", return_value="Summary.")
+    @patch("daily_report.content.prepare_consolidated_content", return_value="# C")
+    def test_populates_content_before_dispatch(self, _mock_c, _mock_s):
+        report = _make_busy_report()
+        _content_module.prepare_both(report, group_by="project")
+        assert [rc.repo_name for rc in report.content] == ["org/alpha", "org/beta"]
+
+    def test_calls_overlap(self):
+        """Each call waits for the other to start, so serial execution would deadlock."""
+        import threading
+        barrier = threading.Barrier(2, timeout=5)
+
+        def _wait(*_args, **_kwargs):
+            barrier.wait()
+            return "ok"
+
+        with patch("daily_report.content.prepare_consolidated_content", side_effect=_wait), \
+             patch("daily_report.content.prepare_ai_summary", side_effect=_wait):
+            assert _content_module.prepare_both(_make_busy_report()) == ("ok", "ok")
+
+    @patch("daily_report.content.prepare_ai_summary", return_value="Summary.")
+    @patch("daily_report.content.prepare_consolidated_content",
+           side_effect=RuntimeError("Claude API call failed: boom"))
+    def test_propagates_errors(self, _mock_c, _mock_s):
+        with pytest.raises(RuntimeError, match="boom"):
+            _content_module.prepare_both(_make_busy_report())
+
+    def test_rejects_running_event_loop(self):
+        import asyncio
+
+        async def _inner():
+            _content_module.prepare_both(_make_busy_report())
+
+        with pytest.raises(RuntimeError, match="aprepare_both"):
+            asyncio.run(_inner())
+
+
+class TestLocalSummary:
+    """Tests for the deterministic local summary."""
+
+    def test_all_categories(self):
+        repos_data = {
+            "org/b": {"reviewed": [{}], "waiting_for_review": [{}, {}]},
+            "org/a": {"authored": [{}], "contributed": [{}]},
+        }
+        assert _content_module._local_summary(repos_data) == (
+            "Worked on 1 PR in org/a; contributed to 1 PR in org/a; "
+            "reviewed 1 PR in org/b; 2 PRs awaiting review in org/b."
+        )
+
+    def test_empty(self):
+        assert _content_module._local_summary({}) == ""
+
+    def test_many_repos_fall_back_to_aggregate(self):
+        repos_data = {f"org/repo-{i:02d}": {"authored": [{}]} for i in range(8)}
+        repos_data.update(
+            {f"org/other-{i:02d}": {"reviewed": [{}]} for i in range(5)},
+        )
+        result = _content_module._local_summary(repos_data)
+        assert result == "8 authored, 5 reviewed, 0 awaiting review across 13 repos."
+        assert len(result) <= 160
+
 
 # ---------------------------------------------------------------------------
 # _build_repos_data tests
@@ -1012,6 +1831,25 @@ class TestBuildReposData:
         pr = data["org/repo"]["reviewed"][0]
         assert pr["body"] == "Fixes null pointer in parser"
         assert pr["changed_files"] == ["src/parser.py"]
+        assert "changed_files_truncated" not in pr
+
+    def test_long_body_and_file_list_truncated(self):
+        report = _make_report(
+            reviewed_prs=[
+                ReviewedPR(
+                    repo="org/repo", title="Big change", number=21,
+                    author="alice", status="Open",
+                    body="x" * 5000,
+                    changed_files=[f"src/f{i}.py" for i in range(100)],
+                ),
+            ],
+        )
+        pr = _build_repos_data(report)["org/repo"]["reviewed"][0]
+        assert pr["body"] == "x" * _content_module._MAX_BODY_CHARS
+        assert pr["changed_files"] == [
+            f"src/f{i}.py" for i in range(_content_module._MAX_CHANGED_FILES)
+        ]
+        assert pr["changed_files_truncated"] is True
 
     def test_empty_body_omitted(self):
         report = _make_report(
@@ -1087,6 +1925,90 @@ class TestLoadPrompt:
         with pytest.raises(FileNotFoundError):
             _load_prompt("nonexistent")
 
+    def test_default_system_blocks_not_shared(self):
+        first = _content_module._system_prompt(None, "summary", "fmt")
+        first[0]["text"] = "mutated"
+        second = _content_module._system_prompt(None, "summary", "fmt")
+        assert second[0]["text"] == _load_prompt("summary")
+        assert second[1] == {"type": "text", "text": "fmt"}
+
+    def test_custom_prompt_returned_as_is(self):
+        assert _content_module._system_prompt("Custom", "summary", "fmt") == "Custom"
+
+
+# ---------------------------------------------------------------------------
+# Response cache tests
+# ---------------------------------------------------------------------------
+
+class TestCachedCall:
+    """Tests for the on-disk response cache."""
+
+    def test_second_call_served_from_cache(self):
+        fn = MagicMock(return_value="summary")
+        assert _content_module._cached_call("sdk", "m", "sys", "user", fn) == "summary"
+        assert _content_module._cached_call("sdk", "m", "sys", "user", fn) == "summary"
+        fn.assert_called_once()
+
+    def test_key_covers_backend_model_prompt_message_and_tools(self):
+        fn = MagicMock(return_value="x")
+        _content_module._cached_call("sdk", "m", "sys", "user", fn)
+        _content_module._cached_call("sdk", "other", "sys", "user", fn)
+        _content_module._cached_call("sdk", "m", [{"type": "text", "text": "sys"}], "user", fn)
+        _content_module._cached_call("sdk", "m", "sys", "other", fn)
+        _content_module._cached_call("agent", "m", "sys", "user", fn)
+        _content_module._cached_call("sdk", "m", "sys", "user", fn, tools=[{"name": "t"}])
+        assert fn.call_count == 6
+
+    def test_expired_entry_refetched(self, monkeypatch):
+        monkeypatch.setenv("DAILY_REPORT_CACHE_TTL", "0")
+        fn = MagicMock(side_effect=["old", "new"])
+        _content_module._cached_call("sdk", "m", "sys", "user", fn)
+        assert _content_module._cached_call("sdk", "m", "sys", "user", fn) == "new"
+
+    def test_no_cache_env_bypasses_cache(self, tmp_path, monkeypatch):
+        monkeypatch.setenv("DAILY_REPORT_NO_CACHE", "1")
+        fn = MagicMock(side_effect=["one", "two"])
+        assert _content_module._cached_call("sdk", "m", "sys", "user", fn) == "one"
+        assert _content_module._cached_call("sdk", "m", "sys", "user", fn) == "two"
+        assert not (tmp_path / "cache").exists()
+
+    def test_empty_response_not_cached(self):
+        fn = MagicMock(side_effect=["", "text"])
+        _content_module._cached_call("sdk", "m", "sys", "user", fn)
+        assert _content_module._cached_call("sdk", "m", "sys", "user", fn) == "text"
+
+    def test_unwritable_cache_dir_falls_through(self, tmp_path, monkeypatch):
+        blocker = tmp_path / "file"
+        blocker.write_text("")
+        monkeypatch.setenv("DAILY_REPORT_CACHE_DIR", str(blocker / "cache"))
+        fn = MagicMock(return_value="text")
+        assert _content_module._cached_call("sdk", "m", "sys", "user", fn) == "text"
+
+    def test_failed_write_leaves_no_temp_file(self, tmp_path):
+        fn = MagicMock(return_value="text")
+        with patch("daily_report.content.os.replace", side_effect=OSError("disk full")):
+            assert _content_module._cached_call("sdk", "m", "sys", "user", fn) == "text"
+        assert list((tmp_path / "cache").iterdir()) == []
+
+    def test_cache_dir_defaults_to_xdg(self, monkeypatch):
+        monkeypatch.delenv("DAILY_REPORT_CACHE_DIR")
+        monkeypatch.setenv("XDG_CACHE_HOME", "/xdg")
+        assert _content_module._response_cache_dir() == Path("/xdg/daily-report")
+
+    @patch("daily_report.content._call_backend_with_tools", return_value="# AI")
+    def test_consolidation_not_cached(self, mock_call):
+        report = _make_busy_report()
+        assert prepare_consolidated_content(report) == "# AI"
+        assert prepare_consolidated_content(report) == "# AI"
+        assert mock_call.call_count == 2
+
+    @patch("daily_report.content._call_backend", return_value="AI summary")
+    def test_prepare_ai_summary_reuses_cached_response(self, mock_call):
+        report = _make_busy_report()
+        assert prepare_ai_summary(report) == "AI summary"
+        assert prepare_ai_summary(report) == "AI summary"
+        mock_call.assert_called_once()
+
 
 # ---------------------------------------------------------------------------
 # PR deduplication tests
@@ -1190,6 +2112,18 @@ class TestPRDeduplication:
         assert "authored" not in repo_data
         assert "reviewed" not in repo_data
 
+    def test_dedup_reflects_in_place_edits(self):
+        report = _make_report(
+            authored_prs=[self._pr_authored(number=1)],
+            reviewed_prs=[self._pr_reviewed(number=1)],
+        )
+        assert _dedup_pr_lists(report)[1] == []
+
+        report.authored_prs[0] = self._pr_authored(number=2)
+        authored, reviewed, _ = _dedup_pr_lists(report)
+        assert [pr.number for pr in authored] == [2]
+        assert [pr.number for pr in reviewed] == [1]
+
 
 # ---------------------------------------------------------------------------
 # CONSOLIDATION_TOOLS structure test
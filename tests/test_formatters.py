@@ -136,6 +136,11 @@ class TestReportDataConstruction:
         assert s.total_prs == 10
         assert s.is_range is True
 
+    @pytest.mark.skipif(sys.version_info < (3, 10), reason="dataclass slots need 3.10+")
+    def test_content_structures_use_slots(self):
+        for obj in (ContentItem(title="t"), ContentBlock(heading="h"), RepoContent(repo_name="r")):
+            assert not hasattr(obj, "__dict__")
+
     def test_report_data_defaults(self):
         r = ReportData(user="u", date_from="2026-01-01", date_to="2026-01-01")
         assert r.authored_prs == []
@@ -185,6 +185,23 @@ class TestRegroupProject:
         # Merged should come before Waiting for Review (per _STATUS_ORDER)
         assert headings.index("Merged") < headings.index("Waiting for Review")
 
+    def test_status_order_independent_of_pr_order(self):
+        report = ReportData(
+            user="alice", date_from="2026-02-10", date_to="2026-02-10",
+            authored_prs=[
+                AuthoredPR(
+                    repo="org/alpha", title=title, number=number,
+                    status=status, additions=0, deletions=0,
+                    contributed=False, original_author=None,
+                )
+                for number, (title, status) in enumerate(
+                    [("c", "Closed"), ("x", "Unknown"), ("d", "Draft"), ("o", "Open")],
+                )
+            ],
+        )
+        blocks = regroup_content(report, "project")[0].blocks
+        assert [b.heading for b in blocks] == ["Open", "Draft", "Closed"]
+
     def test_item_fields_preserved(self):
         alpha = self.content[0]
         open_block = [b for b in alpha.blocks if b.heading == "Open"][0]